@@ -0,0 +1,262 @@
+import fcntl
+import os
+
+"""
+  I2C buses usable by SH1106LCD.
+
+  A bus provides the two smbus.SMBus methods SH1106LCD needs,
+  write_byte_data(address, register, value) and
+  write_i2c_block_data(address, register, data), plus MAX_BLOCK_SIZE, the
+  largest data list a single write_i2c_block_data accepts.  Every call is one
+  I2C transaction; for SH1106 transfers the register byte is the control byte.
+
+  SMBusBus      - python3-smbus, 32 byte blocks
+  I2CDevBus     - raw /dev/i2c-N, a whole page or frame per transaction
+  RecordingBus  - in-memory SH1106 emulation for benchmarks and tests
+"""
+
+# ioctl request selecting the slave address of an i2c-dev file, see linux/i2c-dev.h
+I2C_SLAVE = 0x0703
+# Largest transfer the i2c-dev driver accepts in a single write()
+I2C_DEV_MAX_WRITE = 8192
+
+
+"""
+  Class SH1106Bus
+
+  Base class of all buses, counting the transactions and bytes written.
+  Subclasses implement _transfer(address, data), data being the register
+  byte followed by the payload.
+"""
+
+
+class SH1106Bus:
+    MAX_BLOCK_SIZE = 32
+
+    def __init__(self):
+        self.transactions = 0
+        self.bytesWritten = 0
+
+    def write_byte_data(self, address, register, value):
+        self.__write(address, bytes((register, value)))
+
+    def write_i2c_block_data(self, address, register, data):
+        if len(data) > self.MAX_BLOCK_SIZE:
+            raise ValueError(
+                f"Block of {len(data)} bytes exceeds {self.MAX_BLOCK_SIZE} bytes"
+            )
+        self.__write(address, bytes([register]) + bytes(data))
+
+    def __write(self, address, data):
+        self._transfer(address, data)
+        self.transactions += 1
+        self.bytesWritten += len(data)
+
+    def resetCounters(self):
+        self.transactions = 0
+        self.bytesWritten = 0
+
+    def _transfer(self, address, data):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+"""
+  Class SMBusBus(busNumber)
+
+      busNumber - Number of the I2C adapter
+
+  Uses python3-smbus, limited to 32 data bytes per block write.
+"""
+
+
+class SMBusBus(SH1106Bus):
+    MAX_BLOCK_SIZE = 32
+
+    def __init__(self, busNumber=1):
+        import smbus
+
+        super().__init__()
+        self.smbus = smbus.SMBus(busNumber)
+
+    def _transfer(self, address, data):
+        if len(data) == 2:
+            self.smbus.write_byte_data(address, data[0], data[1])
+        else:
+            self.smbus.write_i2c_block_data(address, data[0], list(data[1:]))
+
+    def close(self):
+        self.smbus.close()
+
+
+"""
+  Class I2CDevBus(busNumber)
+
+      busNumber - N of the /dev/i2c-N device
+
+  Writes straight to /dev/i2c-N.  Unlike SMBus block writes, which are
+  limited to 32 data bytes, a write() can carry a whole page or frame in a
+  single transfer.
+"""
+
+
+class I2CDevBus(SH1106Bus):
+    MAX_BLOCK_SIZE = I2C_DEV_MAX_WRITE - 1
+
+    def __init__(self, busNumber=1):
+        super().__init__()
+        self.path = f"/dev/i2c-{busNumber}"
+        self.fd = os.open(self.path, os.O_RDWR)
+        self.address = None
+
+    def _transfer(self, address, data):
+        if address != self.address:
+            fcntl.ioctl(self.fd, I2C_SLAVE, address)
+            self.address = address
+        os.write(self.fd, data)
+
+    def close(self):
+        os.close(self.fd)
+
+
+"""
+  Class RecordingBus(maxBlockSize)
+
+      maxBlockSize - Block size limit to emulate, 32 like SMBus by default
+
+  Emulates the SH1106 controller in memory: control bytes, page and column
+  addressing and the 8 x 132 Display Data RAM.  Besides the transaction and
+  byte counters it keeps the number of commands and data bytes received and
+  can return the resulting picture with pixels() or as text with render().
+"""
+
+
+class RecordingBus(SH1106Bus):
+    PAGES = 8
+    COLUMNS = 132
+    # Commands followed by one argument byte.  0x20 and 0x8D are not SH1106
+    # commands, but the initialization sequence sends them SSD1306 style.
+    TWO_BYTE_COMMANDS = {0x20, 0x81, 0x8D, 0xA8, 0xAD, 0xD3, 0xD5, 0xD9, 0xDA, 0xDB}
+
+    def __init__(self, maxBlockSize=32):
+        super().__init__()
+        self.MAX_BLOCK_SIZE = maxBlockSize
+        self.ram = [bytearray(self.COLUMNS) for _ in range(self.PAGES)]
+        self.page = 0
+        self.column = 0
+        self.displayOn = False
+        self.commands = 0
+        self.dataBytes = 0
+        self.__argumentOf = None
+
+    def resetCounters(self):
+        super().resetCounters()
+        self.commands = 0
+        self.dataBytes = 0
+
+    def _transfer(self, address, data):
+        i = 0
+        while i < len(data):
+            control = data[i]
+            isData = bool(control & 0x40)
+            if control & 0x80:
+                # Co set: one byte follows, then another control byte.
+                payload = data[i + 1 : i + 2]
+                i += 2
+            else:
+                # Co cleared: the rest of the transfer is a single stream.
+                payload = data[i + 1 :]
+                i = len(data)
+            for b in payload:
+                if isData:
+                    self.__data(b)
+                else:
+                    self.__command(b)
+
+    def __command(self, command):
+        self.commands += 1
+        if self.__argumentOf is not None:
+            self.__argumentOf = None
+            return
+        if command in self.TWO_BYTE_COMMANDS:
+            self.__argumentOf = command
+        elif command <= 0x0F:
+            self.column = (self.column & 0xF0) | command
+        elif command <= 0x1F:
+            self.column = (self.column & 0x0F) | ((command & 0x0F) << 4)
+        elif 0xB0 <= command <= 0xB7:
+            self.page = command & 0x07
+        elif command == 0xAE:
+            self.displayOn = False
+        elif command == 0xAF:
+            self.displayOn = True
+
+    def __data(self, b):
+        self.dataBytes += 1
+        if self.column < self.COLUMNS:
+            self.ram[self.page][self.column] = b
+            self.column += 1
+
+    """
+     pixels()
+
+      Returns the picture as 64 rows of 132 values, 1 for a lit pixel.
+    """
+
+    def pixels(self):
+        return [
+            [(self.ram[y >> 3][x] >> (y & 7)) & 1 for x in range(self.COLUMNS)]
+            for y in range(self.PAGES * 8)
+        ]
+
+    def busTime(self, clockHz=100000, transactionLatency=0.0):
+        return modelBusTime(
+            self.transactions, self.bytesWritten, clockHz, transactionLatency
+        )
+
+    def render(self, on="#", off="."):
+        return "\n".join(
+            "".join(on if p else off for p in row) for row in self.pixels()
+        )
+
+
+"""
+ modelBusTime(transactions, bytesWritten, clockHz, transactionLatency)
+
+     clockHz - I2C clock to model, 100000 or 400000 on the Raspberry Pi
+     transactionLatency - Fixed cost in seconds added per transaction
+                          (driver and scheduling overhead)
+
+  Returns the seconds the given traffic would occupy a real bus.  Every
+  byte takes 9 clocks (8 bits and ACK), each transaction adds the address
+  byte and about 2 clocks for the start and stop conditions.
+"""
+
+
+def modelBusTime(transactions, bytesWritten, clockHz=100000, transactionLatency=0.0):
+    clocks = 9 * (bytesWritten + transactions) + 2 * transactions
+    return clocks / clockHz + transactions * transactionLatency
+
+
+"""
+ openBus(busType, busNumber)
+
+     busType - "smbus" or "i2c-dev"
+     busNumber - Number of the I2C adapter
+
+  Returns a bus of the requested type.  If /dev/i2c-N cannot be opened an
+  SMBus is returned instead.
+"""
+
+
+def openBus(busType="smbus", busNumber=1):
+    if busType == "i2c-dev":
+        try:
+            return I2CDevBus(busNumber)
+        except OSError as e:
+            print(f"Could not open /dev/i2c-{busNumber}, using smbus. Error: {e}")
+    elif busType != "smbus":
+        raise ValueError("Unknown bus type " + str(busType))
+    return SMBusBus(busNumber)
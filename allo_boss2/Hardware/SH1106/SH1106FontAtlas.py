@@ -0,0 +1,150 @@
+import os
+
+"""
+  Class FontAtlas()
+
+  Compact representation of a single page (8 pixel tall) font.  All glyph
+  column bytes are stored in one contiguous bytes buffer, glyph i spanning
+  glyphs[offsets[i]:offsets[i + 1]].  The first glyph is the character
+  with code firstChar, glyphs are laid out in consecutive character codes.
+
+  The atlases used at runtime are precompiled into SH1106Fonts.py from the
+  SH1106FontLib* tables.  Regenerate it after editing one of the tables:
+
+      python3 -m allo_boss2.Hardware.SH1106.SH1106FontAtlas
+"""
+
+INVERT_TABLE = bytes(b ^ 0xFF for b in range(256))
+
+# Generated module and the (table module, table name) it is built from.
+ATLAS_MODULE = "SH1106Fonts.py"
+ATLAS_SOURCES = [
+    ("SH1106FontLib", "capFont"),
+    ("SH1106FontLib1", "capFont1"),
+    ("Line1SH1106FontLib", "Line1"),
+    ("SH1106FontLibNumbers", "Number1"),
+    ("SH1106FontLibNumbers1", "Number2"),
+]
+
+
+class FontAtlas:
+    def __init__(self, glyphs, offsets, firstChar=32, fallback="?"):
+        self.glyphs = bytes(glyphs)
+        self.offsets = tuple(offsets)
+        self.firstChar = firstChar
+        self.count = len(self.offsets) - 1
+
+        # Every glyph followed by its one column spacer, keyed by character.
+        # Composing a line is then a single join over dictionary lookups.
+        self.__glyphs = {}
+        for i in range(self.count):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            self.__glyphs[chr(firstChar + i)] = self.glyphs[start:end] + b"\x00"
+        self.__fallback = self.__glyphs.get(fallback, b"\x00")
+        self.__invertedGlyphs = None
+        self.__invertedFallback = None
+
+    """
+     fromTable(table, firstChar)
+
+         table - List of glyphs, each a list of column bytes
+
+      Builds an atlas from one of the list based SH1106FontLib* tables.
+    """
+
+    @classmethod
+    def fromTable(cls, table, firstChar=32):
+        offsets = [0]
+        for glyph in table:
+            offsets.append(offsets[-1] + len(glyph))
+        glyphs = bytes(b for glyph in table for b in glyph)
+        return cls(glyphs, offsets, firstChar)
+
+    """
+     width(c)
+
+      Returns the width in columns of character c, spacer excluded.
+    """
+
+    def width(self, c):
+        return len(self.__glyphs.get(c, self.__fallback)) - 1
+
+    """
+     glyph(c, inverted)
+
+      Returns the column bytes of character c followed by its spacer column.
+      Characters not in the atlas are rendered with the fallback glyph.
+    """
+
+    def glyph(self, c, inverted=False):
+        if inverted:
+            self.__buildInverted()
+            return self.__invertedGlyphs.get(c, self.__invertedFallback)
+        return self.__glyphs.get(c, self.__fallback)
+
+    """
+     compose(inString, inverted)
+
+      Returns the column bytes of a whole string for this page.
+    """
+
+    def compose(self, inString, inverted=False):
+        if inverted:
+            self.__buildInverted()
+            lookup = self.__invertedGlyphs
+            fallback = self.__invertedFallback
+        else:
+            lookup = self.__glyphs
+            fallback = self.__fallback
+        return b"".join([lookup.get(c, fallback) for c in inString])
+
+    def __buildInverted(self):
+        if self.__invertedGlyphs is None:
+            self.__invertedGlyphs = {
+                c: g.translate(INVERT_TABLE) for c, g in self.__glyphs.items()
+            }
+            self.__invertedFallback = self.__fallback.translate(INVERT_TABLE)
+
+
+"""
+ buildAtlasModule(path)
+
+     path - Where to write the generated module, defaults to SH1106Fonts.py
+            next to this file.
+
+  Generates the precompiled atlas module from the SH1106FontLib* tables.
+"""
+
+
+def buildAtlasModule(path=None):
+    import importlib
+
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ATLAS_MODULE)
+    lines = [
+        "# Generated by SH1106FontAtlas.buildAtlasModule() from the SH1106FontLib*",
+        "# tables.  Do not edit, edit the tables and regenerate instead.",
+        "# Each font is (glyph bytes, glyph offsets).",
+        "",
+    ]
+    for moduleName, tableName in ATLAS_SOURCES:
+        module = importlib.import_module("." + moduleName, __package__)
+        atlas = FontAtlas.fromTable(getattr(module, tableName))
+        lines.append(f"{tableName} = (")
+        for i in range(0, len(atlas.glyphs), 16):
+            lines.append(f"    {atlas.glyphs[i : i + 16]!r}")
+        lines[-1] += ","
+        lines.append("    (")
+        for i in range(0, len(atlas.offsets), 12):
+            offsets = ", ".join(str(o) for o in atlas.offsets[i : i + 12])
+            lines.append(f"        {offsets},")
+        lines.append("    ),")
+        lines.append(")")
+        lines.append("")
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+if __name__ == "__main__":
+    print("Wrote " + buildAtlasModule())
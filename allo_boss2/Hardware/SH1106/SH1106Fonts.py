@@ -0,0 +1,323 @@
+# Generated by SH1106FontAtlas.buildAtlasModule() from the SH1106FontLib*
+# tables.  Do not edit, edit the tables and regenerate instead.
+# Each font is (glyph bytes, glyph offsets).
+
+capFont = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xfc\x00'
+    b'\x00\x00\x00\xf8\xf8\x00\xf8\xf8\x00\x00\x00``\xfc\xfc`'
+    b'`\xfc\xfc`\x00\xe0\xe0\xe0\xf0\xf8\xfc\x00@\x90$\xc8'
+    b'\x10\xe0\x00\x000HH0\x80\xc0`0\x00\xbc\xfe\xe6'
+    b'\xc6\xe6~<\x00\x00\xf8\xf8\x00\x00\x00\x00\x00\x00\x00\xe0'
+    b'\xf8\x0c\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x0c\xf8\xe0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\xfc\xfc\xfc'
+    b'\xc0\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x80\xf0|\x0c\x00\x00\x00\xf0\xf8\x1c\x8c\x8c\x1c\xf8\xf0\x00'
+    b'0\x18\x18\xfc\xfc\x00\x00\x00\x00\x18\x0c\x0c\x0c\x0c\xfc\xf8'
+    b'\x00\x00\x18\x0c\x8c\x8c\x8c\x8c\xfcx\x00\x00\xc0\xe08\x0c'
+    b'\xfc\xfc\x00\x00\xfc\xfc\xcc\xcc\xcc\xcc\x8c\x0c\x00\xe0\xf8\x98'
+    b'\xcc\xcc\xcc\x8c\x00\x00\x0c\x0c\x0c\x0c\x8c\xec|\x1c\x00x'
+    b'\xfc\xcc\x8c\x8c\xcc|8\x00\xf0\xf8\x9c\x0c\x0c\x9c\xf8\xf0'
+    b'\x00\x00ppp\x00\x00\x00\x00\x00\x00\x00ppp\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0\xe0\xe0'
+    b'\xe0\xe0\xe0\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18'
+    b'\x0c\x0c\x0c\x9c\xf8\xf0\x00\xe0\xe0\xe0\xf0\xf8\xfc\x00\x000'
+    b'`\xc0\x80\xc0`0\x00\xe0\xf08\x1c\x1c8\xf0\xe0\x00'
+    b'\xfc\xfc\x8c\x8c\xdc\xfcx\x00\xe0\xf8\x1c\x0c\x0c\x0c\x0c\x1c'
+    b'8\x00\xfc\xfc\x0c\x0c\x0c\x1c\xf8\xf0\x00\xfc\xfc\xcc\xcc\xcc'
+    b'\xcc\xcc\x0c\x00\xfc\xfc\x8c\x8c\x8c\x8c\x8c\x0c\xe0\xf8\x18\x8c'
+    b'\x8c\x8c\x8c\xbc\xb8\x00\xfc\xfc\x80\x80\x80\x80\xfc\xfc\x00\x0c'
+    b'\x0c\x0c\xfc\xfc\x0c\x0c\x0c\x00\x0c\x0c\x0c\xfc\xfc\x0c\x0c\x0c'
+    b'\x00\xfc\xfc\xc0\xe0p8\x1c\x0c\x00\xfc\xfc\x00\x00\x00\x00'
+    b'\x00\x00\x00\xfc\xfc0\xe0\xe00\xfc\xfc\x00\xfc\xfcp\xc0'
+    b'\x00\x00\xfc\xfc\x00\xf0\xf8\x1c\x0c\x0c\x1c\xf8\xf0\x00\xfc\xfc'
+    b'\x0c\x0c\x0c\x9c\xf8\xf0\xf0\xf8\x1c\x0c\x0c\x1c\xf8\xf0\x00\x00'
+    b'\xfc\xfc\x1c\x1c\x1c\x1c\xf8\xf0\x00p\xf8\xfc\xcc\x8c\x0c\x18'
+    b'0\x00\x0c\x0c\x0c\xfc\xfc\x0c\x0c\x0c\x00\xfc\xfc\x00\x00\x00'
+    b'\x00\xfc\xfc\x00\xfc\xfc\x00\x00\x00\x00\xfc\xfc\x00\xfc\xfc\x00'
+    b'\x80\x80\x00\xfc\xfc\x00\x0c<p\xc0\xc0p<\x0c\x00\x0c'
+    b'<\xf0\xc0\xc0\xf0<\x0c\x00\x0c\x0c\x0c\x8c\xcc\xcc|<'
+    b'\x00\xfc\xfc\x0c\x0c\x00\x00\x00\x00\x00\x00\x00\x0c|\xf0\x80'
+    b'\x00\x00\x00\x00\x00\x00\x00\x0c\x0c\xfc\xfc\x00\x80\xe0x\x1c'
+    b'\x0c\x1cx\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x188'
+    b'x\xf0\xe0\x00\x00\x00\x00\x0000000\xf0\xe0\x00'
+    b'\xf0\xf0\x00\x00\x00\x00\x00\x00\x00\xc0\xe0p000p'
+    b'`\x00\x00\x80\x80\x80\x80\x80\xf0\xf0\x00\xc0\xe0000'
+    b'0\xe0\xc0\x00\xe0\xf0000\x00\x00\x00\x00\xe0\xf00'
+    b'00\xe0\xf0\x00\x00\xf0\xf0\x00\x00\x00\x00\x00\x00\x00\xb0'
+    b'\xb0\x00\x00\x00\x00\x00\x00\x00\xb0\xb0\x00\x00\x00\xf0\xf0\x00'
+    b'\x00\x80\x80\x00\x00\x00\xf0\xf0\x00\x00\xe0\xf000\xe00'
+    b'0\xf0\xe0\x00\xe0\xf00000\xf0\xe0\x00\xe0\xf00'
+    b'000\xf0\xe0\x00\xf0\xf0000\xe0\xc0\x00\x00\x00'
+    b'\xc0\xe000\xf0\xf0\x00\x00\xf0\xf0@ \x10\x10\x00\x00'
+    b'\xc0\xe000000 \x00\x00\xc0\xc0\xf0\xf0\xc0\xc0'
+    b'\x00\x00\xf0\xf0\x00\x00\x00\x00\xf0\xf0\x00\xf0\xf0\x00\x00\x00'
+    b'\x00\xf0\xf0\xf0\xf0\x00\x00\x00\x00\x00\xf0\xf0\x00p\xf0\xc0'
+    b'\x00\x00\xc0\xf0p\x00\xf0\xf0\x00\x00\x00\x00\xf0\xf0\x000'
+    b'000\xb0\xf0\xf0p\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xfc\xfc\xfc\x00\x00',
+    (
+        0, 9, 18, 27, 36, 51, 60, 69, 78, 87, 96, 105,
+        114, 123, 132, 141, 150, 159, 168, 177, 186, 195, 204, 213,
+        222, 231, 240, 249, 258, 267, 276, 285, 294, 310, 319, 328,
+        337, 346, 355, 364, 373, 382, 391, 400, 409, 418, 427, 436,
+        445, 454, 463, 472, 481, 490, 499, 508, 517, 526, 535, 544,
+        553, 562, 571, 580, 589, 598, 607, 616, 625, 634, 643, 652,
+        661, 670, 675, 684, 693, 698, 707, 716, 725, 734, 743, 751,
+        760, 769, 778, 787, 796, 805, 814, 823, 832, 841,
+    ),
+)
+
+capFont1 = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0077\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x06??\x06'
+    b'\x06??\x06\x00\x07\x07\x07\x0f\x1f?\x00\x02\t$\x13'
+    b'\x08\x07\x00\x008\x0c\x06\x03\x01\x0c\x12\x12\x0f\x1f90'
+    b'137\x1e<\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07'
+    b'\x1f0 \x00\x00\x00\x00\x00\x00\x00\x00\x00 0\x1f\x07'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01???'
+    b'\x01\x01\x00\x00 0\x1f\x0f\x07\x00\x00\x00\x07\x07\x07\x07'
+    b'\x07\x07\x07\x07\x00<<<<\x00\x00\x00\x00\x000>'
+    b'\x0f\x01\x00\x00\x00\x00\x00\x0f\x1f8118\x1f\x0f\x00'
+    b'000??000\x0008<6310'
+    b'0\x00\x1801111?\x1e\x00\x07\x07\x06\x06\x06'
+    b'??\x06\x00\x1800009\x1f\x0f\x00\x0f\x1f9'
+    b'009\x1f\x0f\x00\x000<\x1f\x07\x01\x00\x00\x00\x1c'
+    b'>3113?\x1e\x0001333\x19\x1f\x07'
+    b'\x00\x00888\x00\x00\x00\x00\x00\x000>\x1e\x0e\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x1c\x1c\x1c'
+    b'\x1c\x1c\x1c\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0077\x01\x01\x00\x00\x07\x07\x07\x0f\x1f?\x00\x00\x0c'
+    b'\x06\x03\x01\x03\x06\x0c\x00??\x06\x06\x06\x06??\x00'
+    b'??111;?\x1e\x07\x1f800008'
+    b'\x1c\x00??0008\x1f\x0f\x00??111'
+    b'110\x00??\x01\x01\x01\x01\x01\x00\x07\x1f\x181'
+    b'111?\x1f\x00??\x01\x01\x01\x01??\x000'
+    b'00??000\x00\x1c80?\x1f\x00\x00\x00'
+    b'\x00??\x03\x07\x0e\x1c80\x00??0000'
+    b'00\x00??\x00\x00\x00\x00??\x00??\x00\x01'
+    b'\x07\x1c??\x00\x0f\x1f8008\x1f\x0f\x00??'
+    b'\x03\x03\x03\x03\x01\x00\x07\x0f\x1c\x18\x18\x1c\x1f70\x00'
+    b'??\x03\x03\x03\x07=8\x00\x180acg\x7f>'
+    b'\x1c\x00\x00\x00\x00??\x00\x00\x00\x00\x0f\x1f800'
+    b'8\x1f\x0f\x00\x03\x0f\x1c00\x1c\x0f\x03\x00??\x1c'
+    b'\x07\x07\x1c??\x000<\x0e\x03\x03\x0e<0\x00\x00'
+    b'\x00\x00??\x00\x00\x00\x00<>731000'
+    b'\x00??00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x0f'
+    b'>0\x00\x00\x00\x00\x0000??\x00\x01\x01\x00\x00'
+    b'\x00\x00\x00\x01\x0088888888\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x1e?3333??\x00'
+    b'??3333?\x1e\x00\x0f\x1f80008'
+    b'\x18\x00\x1f?1111??\x00\x0f\x1f333'
+    b'3\x13\x01\x00??\x03\x03\x00\x00\x00\x00\x00\x19;;'
+    b'33?\x1f\x00\x00??\x03\x03?>\x00\x00\x00?'
+    b'?\x00\x00\x00\x00\x180 ?\x1f\x00\x00\x00??\x06'
+    b'\x0f\x190 \x00\x00??\x00\x00??\x00\x00\x0f\x00'
+    b'\x00??\x00??\x00\x00\x00\x00??\x00\x1f?0'
+    b'000?\x1f\x00??\x03\x03\x03\x01\x00\x00\x00\x00'
+    b'\x00\x01\x03\x03??\x10\x00??\x00\x00\x00\x00\x00\x00'
+    b'\x1133333\x1f\x0e\x00\x00\x00\x00\x1f?0\x10'
+    b'\x00\x00\x0f\x1f0000\x1f\x0f\x00\x03\x0f\x1c00'
+    b'\x1c\x0f\x03\x0f\x1f0\x1c\x0f\x1c0\x1f\x0f\x008<\x0c'
+    b'\x03\x03\x0c<8\x00\x00\x113333\x1f\x0f\x008'
+    b'<>73100\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00???\x00\x00',
+    (
+        0, 9, 18, 27, 36, 51, 60, 69, 78, 87, 96, 105,
+        114, 123, 132, 141, 150, 159, 168, 177, 186, 195, 204, 213,
+        222, 231, 240, 249, 258, 267, 276, 285, 294, 310, 319, 328,
+        337, 346, 355, 364, 373, 382, 391, 400, 409, 418, 427, 436,
+        445, 454, 463, 472, 481, 490, 499, 508, 517, 526, 535, 544,
+        553, 562, 571, 580, 589, 598, 607, 616, 625, 634, 643, 652,
+        661, 670, 675, 684, 693, 698, 707, 716, 725, 734, 743, 751,
+        760, 769, 778, 787, 796, 805, 814, 823, 832, 841,
+    ),
+)
+
+Line1 = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\\x00\x00\x00\x00'
+    b'\x00\x00\x1c\x00\x1c\x00\x00\x00\x00\x00(|(|(\x00'
+    b'\x00\x00HT\xfeT$\x00\x00\x08T(\x10(T '
+    b'\x00`\x9e\x92\xban\xb0\x00\x00\x00\x1c\x00\x00\x00\x00\x00'
+    b'\x00\x00<B\x00\x00\x00\x00\x00\x00\x00\x00B<\x00\x00'
+    b'\x00\x00$\x18\x18$\x00\x00\x00\x00\x10\x10|\x10\x10\x00'
+    b'\x00\x00@8\x18\x00\x00\x00\x00\x00\x10\x10\x10\x10\x00\x00'
+    b'\x00\x0000\x00\x00\x00\x00\x00@`0\x18\x0c\x06\x00'
+    b'\x00<BBB<\x00\x00\x000\x18\xfc\xfc\x00\x00\x00'
+    b'DbRJD\x00\x00\x00$BJJJ4\x00\x00'
+    b'0($"~ \x00\x00.JJJJ2\x00\x00'
+    b'<JJJJ0\x00\x00\x00\x02b\x12\n\x06\x00\x00'
+    b'4JJJJ4\x00\x00\x0cRRRR<\x00\x00'
+    b'\x00ll\x00\x00\x00\x00\x00\x00\xacl\x00\x00\x00\x00\x00'
+    b'\x10((HD\x00\x00\x00\x00((((\x00\x00\x00'
+    b'\x00D(((\x10\x00\x00\x00\x04\xb4\x14\x18\x00\x00\x00'
+    b'<B\x99\xa5\xa5\xbe\x00\x00|\x12\x12\x12\x12|\x00\x00'
+    b'~JJJJ4\x00\x00<BBBB$\x00\x00'
+    b'~BBBB<\x00\x00~JJJJB\x00\x00'
+    b'~\n\n\n\x02\x02\x00\x00<BRRR4\x00\x00'
+    b'~\x08\x08\x08\x08~\x00\x00BB~BB\x00\x00\x00'
+    b'"BB>\x02\x02\x00\x00~\x08\x14b\x00\x00\x00\x00'
+    b'~@@@@\x00\x00\x00~\x02\x04\x18\x04\x02~\x00'
+    b'~\x02\x0c0@~\x00\x00<BBBB<\x00\x00'
+    b'~\x12\x12\x12\x12\x0c\x00\x00<BBB<@\x00\x00'
+    b'~\x12\x12\x12l\x00\x00\x00$JJRR$\x00\x00'
+    b'\x02\x02~\x02\x02\x00\x00\x00>@@@@>\x00\x00'
+    b'\x06\x18 @ \x18\x06\x00~@ \x18 @~\x00'
+    b'f\x14\x08\x08\x14f\x00\x00\x02\x04x\x04\x02\x00\x00\x00'
+    b'BbRJFB\x00\x00\x00~B\x00\x00\x00\x00\x00'
+    b'\x06\x0c\x180`@\x00\x00\x00\x00\x00B~\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00 TTx\x00\x00\x00'
+    b'\x00|HH0\x00\x00\x00\x008DD(\x00\x00\x00'
+    b'\x000HH|\x00\x00\x00\x008TTX\x00\x00\x00'
+    b'\x00\x10|\x14\x00\x00\x00\x00\x00\x18\xa4\xa4\xf8\x00\x00\x00'
+    b'\x00|\x10\x10`\x00\x00\x00\x00\x00t\x00\x00\x00\x00\x00'
+    b'\x00 @t\x00\x00\x00\x00\x00|\x10(D\x00\x00\x00'
+    b'\x00\x00|\x00\x00\x00\x00\x00x\x04\x048\x04\x04x\x00'
+    b'\x00|\x04\x04\x04x\x00\x00\x008DDD8\x00\x00'
+    b'\x00|$$\x18\x00\x00\x00\x00\x18$$x\x00\x00\x00'
+    b'\x00|\x08\x04\x04\x00\x00\x00\x00XTT$\x00\x00\x00'
+    b'\x00\x08|H\x00\x00\x00\x00\x00<@@<\x00\x00\x00'
+    b'\x1c @@ \x1c\x00\x00<@@8@@<\x00'
+    b'\x00l\x10l\x00\x00\x00\x00\x00LPP<\x00\x00\x00'
+    b'DdTLD\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00~\x00\x00\x00\x00',
+    (
+        0, 8, 16, 24, 32, 40, 48, 56, 64, 72, 80, 88,
+        96, 104, 112, 120, 128, 136, 143, 151, 159, 167, 175, 183,
+        191, 199, 207, 215, 223, 231, 239, 247, 255, 263, 271, 279,
+        287, 295, 303, 311, 319, 327, 335, 343, 351, 359, 367, 375,
+        383, 391, 399, 407, 415, 423, 431, 439, 447, 455, 463, 471,
+        479, 487, 495, 503, 511, 519, 527, 535, 543, 551, 559, 567,
+        575, 583, 591, 599, 607, 615, 623, 631, 639, 647, 655, 663,
+        671, 679, 687, 695, 703, 711, 719, 727, 735, 743,
+    ),
+)
+
+Number1 = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xfc\x00'
+    b'\x00\x00\x00\xf8\xf8\x00\xf8\xf8\x00\x00\x00``\xfc\xfc`'
+    b'`\xfc\xfc`\x00\xe0\xf0\x98\xfe\xfe\x98\x980\x000H'
+    b'H0\x80\xc0`0\x00\xbc\xfe\xe6\xc6\xe6~<\x00\x00'
+    b'\xf8\xf8\x00\x00\x00\x00\x00\x00\x00\xe0\xf8\x0c\x04\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x04\x0c\xf8\xe0\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xc0\xc0\xc0\xfc\xfc\xfc\xc0\xc0\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x80\xf0|\x0c\x00\x00\x00\xf8\xfc\x0c'
+    b'\x0c\xfc\xf8\x000\x18\xfc\xfc\x00\x00\x00\x18\x1c\x0c\x0c\xfc'
+    b'\xf8\x00\x18\x0c\x8c\x8c\xfcx\x00\x80\xf0<\xfc\xfc\x00\x00'
+    b'\xfc\xfc\x8c\x8c\x8c\x0c\x00\xf8\xfc\x8c\x8c\x8c\x00\x00\x0c\x0c'
+    b'\x0c\xcc\xfc<\x00x\xfc\x8c\x8c\xfcx\x00\xf8\xfc\x8c\x8c'
+    b'\xfc\xf8\x00\x00ppp\x00\x00\x00\x00\x00\x00\x00pp'
+    b'p\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0'
+    b'\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x18\x0c\x0c\x0c\x9c\xf8\xf0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\xe0\xf08\x1c\x1c8\xf0\xe0\x00\xfc\xfc\x8c\x8c\xdc'
+    b'\xfcx\x00\xe0\xf8\x1c\x0c\x0c\x0c\x0c\x1c8\x00\xfc\xfc\x0c'
+    b'\x0c\x0c\x1c\xf8\xf0\x00\xfc\xfc\xcc\xcc\xcc\xcc\xcc\x0c\x00\xfc'
+    b'\xfc\x8c\x8c\x8c\x8c\x8c\x0c\xe0\xf8\x18\x8c\x8c\x8c\x8c\xbc\xb8'
+    b'\x00\xfc\xfc\x80\x80\x80\x80\xfc\xfc\x00\x0c\x0c\x0c\xfc\xfc\x0c'
+    b'\x0c\x0c\x00\x0c\x0c\x0c\xfc\xfc\x0c\x0c\x0c\x00\xfc\xfc\xc0\xe0'
+    b'p8\x1c\x0c\x00\xfc\xfc\x00\x00\x00\x00\x00\x00\x00\xfc\xfc'
+    b'0\xe0\xe00\xfc\xfc\x00\xfc\xfcp\xc0\x00\x00\xfc\xfc\x00'
+    b'\xf0\xf8\x1c\x0c\x0c\x1c\xf8\xf0\x00\xfc\xfc\x0c\x0c\x0c\x9c\xf8'
+    b'\xf0\xf0\xf8\x1c\x0c\x0c\x1c\xf8\xf0\x00\x00\xfc\xfc\x1c\x1c\x1c'
+    b'\x1c\xf8\xf0\x00p\xf8\xfc\xcc\x8c\x0c\x180\x00\x0c\x0c\x0c'
+    b'\xfc\xfc\x0c\x0c\x0c\x00\xfc\xfc\x00\x00\x00\x00\xfc\xfc\x00\xfc'
+    b'\xfc\x00\x00\x00\x00\xfc\xfc\x00\xfc\xfc\x00\x80\x80\x00\xfc\xfc'
+    b'\x00\x0c<p\xc0\xc0p<\x0c\x00\x0c<\xf0\xc0\xc0\xf0'
+    b'<\x0c\x00\x0c\x0c\x0c\x8c\xcc\xcc|<\x00\xfc\xfc\x0c\x0c'
+    b'\x00\x00\x00\x00\x00\x00\x00\x0c|\xf0\x80\x00\x00\x00\x00\x00'
+    b'\x00\x00\x0c\x0c\xfc\xfc\x00\x80\xe0x\x1c\x0c\x1cx\xe0\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x188x\xf0\xe0\x00\x00'
+    b'\x00\x00\x0000000\xf0\xe0\x00\xf0\xf0\x00\x00\x00'
+    b'\x00\x00\x00\x00\xc0\xe0p000p`\x00\x00\x80\x80'
+    b'\x80\x80\x80\xf0\xf0\x00\xc0\xe00000\xe0\xc0\x00\xe0'
+    b'\xf0000\x00\x00\x00\x00\xe0\xf0000\xe0\xf0\x00'
+    b'\x00\xf0\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xb0\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\xb0\xb0\x00\x00\x00\xf0\xf0\x00\x00'
+    b'\x80\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x00\x00\x00\xe0\xf00'
+    b'0\xe000\xf0\xe0\x00\xe0\xf00000\xf0\xe0\x00'
+    b'\xe0\xf00000\xf0\xe0\x00\xf0\xf0000\xe0\xc0'
+    b'\x00\x00\x00\xc0\xe000\xf0\xf0\x00\x00\xf0\xf0@ \x10'
+    b'\x10\x00\x00\x00\xc0\xe000000 \x00\x00\xc0\xc0'
+    b'\xf0\xf0\xc0\xc0\x00\x00\xf0\xf0\x00\x00\x00\x00\xf0\xf0\x00\xf0'
+    b'\xf0\x00\x00\x00\x00\xf0\xf0\xf0\xf0\x00\x00\x00\x00\x00\xf0\xf0'
+    b'\x00p\xf0\xc0\x00\x00\xc0\xf0p\x00\xf0\xf0\x00\x00\x00\x00'
+    b'\xf0\xf0\x000000\xb0\xf0\xf0p\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xfc\xfc\x00\x00',
+    (
+        0, 9, 18, 27, 36, 45, 54, 63, 72, 81, 90, 99,
+        108, 117, 126, 131, 140, 147, 154, 161, 168, 175, 182, 189,
+        196, 203, 210, 219, 228, 237, 246, 255, 264, 273, 282, 291,
+        300, 309, 318, 327, 336, 345, 354, 363, 372, 381, 390, 399,
+        408, 417, 426, 435, 444, 453, 462, 471, 480, 489, 498, 507,
+        516, 525, 534, 543, 552, 561, 570, 579, 588, 597, 606, 615,
+        624, 633, 642, 651, 660, 669, 678, 687, 696, 705, 714, 723,
+        732, 741, 750, 759, 768, 777, 786, 795, 804, 813,
+    ),
+)
+
+Number2 = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xfc\x00'
+    b'\x00\x00\x00\xf8\xf8\x00\xf8\xf8\x00\x00\x00``\xfc\xfc`'
+    b'`\xfc\xfc`\x00\xe0\xf0\x98\xfe\xfe\x98\x980\x000H'
+    b'H0\x80\xc0`0\x00\xbc\xfe\xe6\xc6\xe6~<\x00\x00'
+    b'\xf8\xf8\x00\x00\x00\x00\x00\x00\x00\xe0\xf8\x0c\x04\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x04\x0c\xf8\xe0\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xc0\xc0\xc0\xfc\xfc\xfc\xc0\xc0\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'00\x00\x00\x00\x00\x80\xf0|\x0c\x00\x00\x00\x1f?0'
+    b'0?\x1f\x0000??00\x008<631'
+    b'0\x00\x18011?\x1e\x00\x0f\r\x0c??\x0c\x00'
+    b'\x19111?\x1f\x00\x1f?11?\x1f\x000<'
+    b'\x0f\x03\x00\x00\x00\x1e?11?\x1e\x00\x18111'
+    b'?\x1f\x00\x00ppp\x00\x00\x00\x00\x00\x00\x00pp'
+    b'p\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0'
+    b'\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x18\x0c\x0c\x0c\x9c\xf8\xf0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\xe0\xf08\x1c\x1c8\xf0\xe0\x00\xfc\xfc\x8c\x8c\xdc'
+    b'\xfcx\x00\xe0\xf8\x1c\x0c\x0c\x0c\x0c\x1c8\x00\xfc\xfc\x0c'
+    b'\x0c\x0c\x1c\xf8\xf0\x00\xfc\xfc\xcc\xcc\xcc\xcc\xcc\x0c\x00\xfc'
+    b'\xfc\x8c\x8c\x8c\x8c\x8c\x0c\xe0\xf8\x18\x8c\x8c\x8c\x8c\xbc\xb8'
+    b'\x00\xfc\xfc\x80\x80\x80\x80\xfc\xfc\x00\x0c\x0c\x0c\xfc\xfc\x0c'
+    b'\x0c\x0c\x00\x0c\x0c\x0c\xfc\xfc\x0c\x0c\x0c\x00\xfc\xfc\xc0\xe0'
+    b'p8\x1c\x0c\x00\xfc\xfc\x00\x00\x00\x00\x00\x00\x00\xfc\xfc'
+    b'0\xe0\xe00\xfc\xfc\x00\xfc\xfcp\xc0\x00\x00\xfc\xfc\x00'
+    b'\xf0\xf8\x1c\x0c\x0c\x1c\xf8\xf0\x00\xfc\xfc\x0c\x0c\x0c\x9c\xf8'
+    b'\xf0\xf0\xf8\x1c\x0c\x0c\x1c\xf8\xf0\x00\x00\xfc\xfc\x1c\x1c\x1c'
+    b'\x1c\xf8\xf0\x00p\xf8\xfc\xcc\x8c\x0c\x180\x00\x0c\x0c\x0c'
+    b'\xfc\xfc\x0c\x0c\x0c\x00\xfc\xfc\x00\x00\x00\x00\xfc\xfc\x00\xfc'
+    b'\xfc\x00\x00\x00\x00\xfc\xfc\x00\xfc\xfc\x00\x80\x80\x00\xfc\xfc'
+    b'\x00\x0c<p\xc0\xc0p<\x0c\x00\x0c<\xf0\xc0\xc0\xf0'
+    b'<\x0c\x00\x0c\x0c\x0c\x8c\xcc\xcc|<\x00\xfc\xfc\x0c\x0c'
+    b'\x00\x00\x00\x00\x00\x00\x00\x0c|\xf0\x80\x00\x00\x00\x00\x00'
+    b'\x00\x00\x0c\x0c\xfc\xfc\x00\x80\xe0x\x1c\x0c\x1cx\xe0\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x188x\xf0\xe0\x00\x00'
+    b'\x00\x00\x0000000\xf0\xe0\x00\xf0\xf0\x00\x00\x00'
+    b'\x00\x00\x00\x00\xc0\xe0p000p`\x00\x00\x80\x80'
+    b'\x80\x80\x80\xf0\xf0\x00\xc0\xe00000\xe0\xc0\x00\xe0'
+    b'\xf0000\x00\x00\x00\x00\xe0\xf0000\xe0\xf0\x00'
+    b'\x00\xf0\xf0\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xb0\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\xb0\xb0\x00\x00\x00\xf0\xf0\x00\x00'
+    b'\x80\x80\x00\x00\x00\xf0\xf0\x00\x00\x00\x00\x00\x00\xe0\xf00'
+    b'0\xe000\xf0\xe0\x00\xe0\xf00000\xf0\xe0\x00'
+    b'\xe0\xf00000\xf0\xe0\x00\xf0\xf0000\xe0\xc0'
+    b'\x00\x00\x00\xc0\xe000\xf0\xf0\x00\x00\xf0\xf0@ \x10'
+    b'\x10\x00\x00\x00\xc0\xe000000 \x00\x00\xc0\xc0'
+    b'\xf0\xf0\xc0\xc0\x00\x00\xf0\xf0\x00\x00\x00\x00\xf0\xf0\x00\xf0'
+    b'\xf0\x00\x00\x00\x00\xf0\xf0\xf0\xf0\x00\x00\x00\x00\x00\xf0\xf0'
+    b'\x00p\xf0\xc0\x00\x00\xc0\xf0p\x00\xf0\xf0\x00\x00\x00\x00'
+    b'\xf0\xf0\x000000\xb0\xf0\xf0p\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xfc\xfc\x00\x00',
+    (
+        0, 9, 18, 27, 36, 45, 54, 63, 72, 81, 90, 99,
+        108, 117, 126, 131, 140, 147, 154, 161, 168, 175, 182, 189,
+        196, 203, 210, 219, 228, 237, 246, 255, 264, 273, 282, 291,
+        300, 309, 318, 327, 336, 345, 354, 363, 372, 381, 390, 399,
+        408, 417, 426, 435, 444, 453, 462, 471, 480, 489, 498, 507,
+        516, 525, 534, 543, 552, 561, 570, 579, 588, 597, 606, 615,
+        624, 633, 642, 651, 660, 669, 678, 687, 696, 705, 714, 723,
+        732, 741, 750, 759, 768, 777, 786, 795, 804, 813,
+    ),
+)
@@ -0,0 +1,103 @@
+import hashlib
+import mmap
+import os
+import struct
+
+"""
+  Class ImageCache()
+
+      directory - Where cache files are kept.  Created on first store.
+
+  On-disk cache of images already packed into SH1106 pages, so they do not
+  have to be decoded and converted again on every start.  Every source
+  image gets its own cache file named after the hash of its absolute path:
+
+      header - magic, source mtime (ns), source size, width, height, pages
+      data   - pages * width bytes, page after page
+
+  An entry is only used while the mtime and size of the source still match
+  the header, a changed source is converted again and its entry rewritten.
+"""
+
+DEFAULT_CACHE_DIR = "/var/cache/allo_boss2"
+
+
+class ImageCache:
+    MAGIC = b"SHI1"
+    HEADER = struct.Struct("<4sqqHHH")
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def __entryPath(self, filename):
+        key = hashlib.sha1(os.path.abspath(filename).encode()).hexdigest()
+        return os.path.join(self.directory, key + ".img")
+
+    """
+     load(filename)
+
+         filename - Source image file.
+
+      Returns (width, height, pages) for an up to date entry, pages being a
+      list with the column bytes of every page.  Returns None when there is
+      no usable entry.
+    """
+
+    def load(self, filename):
+        try:
+            source = os.stat(filename)
+            with open(self.__entryPath(filename), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as entry:
+                    if len(entry) < self.HEADER.size:
+                        return None
+                    magic, mtime, size, width, height, pages = self.HEADER.unpack_from(
+                        entry
+                    )
+                    if (
+                        magic != self.MAGIC
+                        or mtime != source.st_mtime_ns
+                        or size != source.st_size
+                        or len(entry) != self.HEADER.size + width * pages
+                    ):
+                        return None
+                    data = []
+                    for page in range(pages):
+                        start = self.HEADER.size + page * width
+                        data.append(entry[start : start + width])
+                    return width, height, data
+        except (OSError, ValueError):
+            # Missing entry, or an empty file which mmap refuses.
+            return None
+
+    """
+     store(filename, width, height, pages)
+
+      Writes the packed pages of filename to the cache.  The entry is
+      written to a temporary file and renamed, so a concurrent load never
+      sees a partial entry.  Returns False if the cache is not writable.
+    """
+
+    def store(self, filename, width, height, pages):
+        path = self.__entryPath(filename)
+        tmpPath = path + ".tmp"
+        try:
+            source = os.stat(filename)
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmpPath, "wb") as f:
+                f.write(
+                    self.HEADER.pack(
+                        self.MAGIC,
+                        source.st_mtime_ns,
+                        source.st_size,
+                        width,
+                        height,
+                        len(pages),
+                    )
+                )
+                for page in pages:
+                    f.write(page)
+            os.replace(tmpPath, path)
+        except OSError as e:
+            print(f"Could not cache image {filename}: {e}")
+            return False
+        return True
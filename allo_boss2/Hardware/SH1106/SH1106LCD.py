@@ -1,13 +1,16 @@
-import smbus
 import time
-from PIL import Image
+from collections import OrderedDict
+from contextlib import contextmanager
 import traceback
-from .SH1106FontLib import *
-from .Line1SH1106FontLib import *
-from .SH1106FontLib1 import *
-from .SH1106FontLibNumbers import *
-from .SH1106FontLibNumbers1 import *
 
+from .SH1106Bus import openBus
+from .SH1106FontAtlas import FontAtlas
+from .SH1106ImageCache import DEFAULT_CACHE_DIR, ImageCache
+
+# Grayscale value -> pixel "ON" (1) or "OFF" (0)
+PIXEL_TABLE = bytes(1 if v >= 128 else 0 for v in range(256))
+# Pixel (0 or 1) -> its bit in the page byte, one table per row of a page
+BIT_TABLES = [bytes([0, 1 << bit]) + bytes(254) for bit in range(8)]
 
 """
   Class SH1106LCD()
@@ -29,6 +32,10 @@ from .SH1106FontLibNumbers1 import *
   automatically incremented with each byte allowing continuous writing
   to memory. The cursor can also be manually set to any position in RAM.
 
+  All drawing methods of this class only alter an in-memory frame buffer
+  with the same layout.  Call flush() to transmit the changed parts of
+  the frame buffer to the Display Data RAM.
+
      | Col 0 | Col 1 | Col 2 | ... | Col 131 |
    ---------------------------------------------------
      |  D0   |  D0   |
@@ -54,26 +61,94 @@ from .SH1106FontLibNumbers1 import *
 
 
 class SH1106LCD:
-    def __init__(self):
-        # Default i2c bus
-        self.bus = smbus.SMBus(1)
+    PAGES = 8
+    COLUMNS = 132
+    # The first two Display Data Ram columns are not visible on the panel.
+    COLUMN_OFFSET = 2
+    # Unchanged columns tolerated inside one flushed span.
+    SPAN_MERGE_GAP = 8
+    # Largest data payload of a single SMBus block write, buses may allow more.
+    MAX_BLOCK_SIZE = 32
+    # Default number of rendered strings kept by renderText().
+    TEXT_CACHE_SIZE = 64
+    # Seconds to wait before the initialization commands, the panel is
+    # powered long before the service starts, and after the display on
+    # command for the charge pump to settle (at least 100 ms in the
+    # datasheet, with 50 ms margin)
+    POWER_ON_DELAY = 0.01
+    DISPLAY_ON_DELAY = 0.15
+
+    def __init__(
+        self,
+        textCacheSize=TEXT_CACHE_SIZE,
+        imageCacheDir=DEFAULT_CACHE_DIR,
+        busType="smbus",
+        busNumber=1,
+        bus=None,
+    ):
+        # Default i2c bus, "i2c-dev" sends a whole page per transfer.  Any
+        # SH1106Bus, e.g. a RecordingBus, can be passed in instead.
+        if bus is None:
+            bus = openBus(busType, busNumber)
+        self.bus = bus
+        self.maxBlockSize = getattr(self.bus, "MAX_BLOCK_SIZE", self.MAX_BLOCK_SIZE)
         self.OLED_Address = 0x3C
         self.OLED_Command_Mode = 0x80
         self.OLED_Data_Mode = 0x40
+        # Control byte with the Co bit cleared: every following byte of the
+        # transfer is a command.
+        self.OLED_Command_Stream = 0x00
+        # Commands queued by commandBatch(), None when not batching.
+        self.__commandQueue = None
+
+        # In-memory copy of the Display Data Ram.  Drawing only touches the
+        # frame buffer, flush() pushes the differences to the panel.
+        self.frameBuffer = [bytearray(self.COLUMNS) for _ in range(self.PAGES)]
+        # What the panel currently holds, None when unknown.
+        self.__panel = None
+        # Pages drawn on since the last flush(), the only ones it compares.
+        self.__dirtyPages = set(range(self.PAGES))
 
         # Initialize the screen.
         self.__initialize()
         self.clearScreen()
+        self.flush()
 
-        # Set up internal image buffer
+        # Set up internal image buffer, backed by the on-disk cache unless
+        # imageCacheDir is None
         self.imageBuffer = {}
+        self.imageCache = None
+        if imageCacheDir is not None:
+            self.imageCache = ImageCache(imageCacheDir)
+
+        # Fonts are loaded by the first text drawn, see fonts
+        self.__fonts = None
+
+        # LRU cache of rendered strings, see renderText()
+        self.textCacheSize = textCacheSize
+        self.textCacheHits = 0
+        self.textCacheMisses = 0
+        self.__textCache = OrderedDict()
+
+    """
+     fonts
+
+      Font name -> one atlas per page the font spans, top page first.  The
+      atlases are imported on first use, a display showing only images
+      never loads them.
+    """
+
+    @property
+    def fonts(self):
+        if self.__fonts is None:
+            from .SH1106Fonts import capFont, capFont1, Line1, Number1, Number2
 
-        # Import font
-        self.font = capFont
-        self.font1 = capFont1
-        self.fontLine1 = Line1
-        self.fontNumber = Number1
-        self.fontNumber1 = Number2
+            self.__fonts = {
+                "cap": (FontAtlas(*capFont), FontAtlas(*capFont1)),
+                "number": (FontAtlas(*Number1), FontAtlas(*Number2)),
+                "line1": (FontAtlas(*Line1),),
+            }
+        return self.__fonts
 
     """
      initialize()
@@ -82,7 +157,13 @@ class SH1106LCD:
     """
 
     def __initialize(self):
-        time.sleep(0.25)
+        time.sleep(self.POWER_ON_DELAY)
+        with self.commandBatch():
+            self.__initCommands()
+
+        time.sleep(self.DISPLAY_ON_DELAY)
+
+    def __initCommands(self):
         self.__sendCommand(0xAE)
         self.__sendCommand(0x20)
         self.__sendCommand(0x10)
@@ -114,8 +195,6 @@ class SH1106LCD:
         self.__sendCommand(0x14)
         self.__sendCommand(0xAF)
 
-        time.sleep(0.5)
-
     """
      powerUp()
 
@@ -142,68 +221,109 @@ class SH1106LCD:
 
         row - The row to blank (0 - 7)
 
-      Writes 0x00 to every address in Display Data Ram
-      for a given row.  This will blank the row.
+      Writes 0x00 to every column of the frame buffer for a given row.
+      This will blank the row on the next flush().
     """
 
     def clearRow(self, row):
-        page = 0xB0 + row
-        self.__sendCommand(page)
-        # Send 32 bytes at a time (max the bus can take) until we clear the first 128 columns.
-        for i in range(4):
-            self.__sendData(
-                [
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                    0x00,
-                ]
-            )
-        # Send the last 4 bytes to zero out all 132 columns
-        self.__sendData([0x00, 0x00, 0x00, 0x00])
+        self.frameBuffer[row][:] = bytes(self.COLUMNS)
+        self.__dirtyPages.add(row)
+
+    """
+     clearColumns(row, col, width, rows)
+
+         col - First column to blank, same numbering as setCursorPosition
+         width - Number of columns to blank
+         rows - Number of rows (pages) starting at row, 2 for a cap font line
+
+      Writes 0x00 to part of the frame buffer, e.g. what is left of a longer
+      text after a shorter one was drawn over it.
+    """
+
+    def clearColumns(self, row, col, width, rows=1):
+        start = max(col + self.COLUMN_OFFSET, 0)
+        end = min(col + self.COLUMN_OFFSET + width, self.COLUMNS)
+        if start < end:
+            for page in range(row, min(row + rows, self.PAGES)):
+                self.frameBuffer[page][start:end] = bytes(end - start)
+                self.__dirtyPages.add(page)
+
+    """
+     invalidate(row)
+
+         row - Row (page) written to frameBuffer directly, None for all rows
+
+      Makes the next flush() compare the row against the panel.  Drawing
+      methods do this themselves, only direct frameBuffer writes need it.
+    """
+
+    def invalidate(self, row=None):
+        if row is None:
+            self.__dirtyPages.update(range(self.PAGES))
+        else:
+            self.__dirtyPages.add(row)
 
     """
      clearScreen()
 
-      Writes 0x00 to every address in the Display Data Ram
-      effectively making the screen completely black.
-      Should be called on first connection of the LCD as
-      when uninitialized the LCD will display random pixels.
+      Writes 0x00 to every address in the frame buffer effectively
+      making the screen completely black on the next flush().
     """
 
     def clearScreen(self):
-        for i in range(8):
+        for i in range(self.PAGES):
             self.clearRow(i)
-            self.__sendCommand(0x00)  # reset column address
-            self.__sendCommand(0x10)  # reset column address
+
+    """
+     flush()
+
+      Transmits the frame buffer to the Display Data Ram.  Only pages drawn
+      on since the last flush are compared against a shadow copy of what the
+      panel currently holds, and only their changed column spans are sent.
+      If the panel content is unknown (first flush, or after raw sendData
+      calls) every page is sent in full.
+    """
+
+    def flush(self):
+        if self.__panel is None:
+            for page, frame in enumerate(self.frameBuffer):
+                self.__writeAt(page, 0, frame)
+            self.__panel = [bytearray(frame) for frame in self.frameBuffer]
+        else:
+            for page in sorted(self.__dirtyPages):
+                frame = self.frameBuffer[page]
+                for start, end in self.__changedSpans(self.__panel[page], frame):
+                    self.__writeAt(page, start, frame[start:end])
+                self.__panel[page][:] = frame
+        self.__dirtyPages.clear()
+
+    """
+     __changedSpans(shadow, frame)
+
+         shadow - Page bytes currently held by the panel
+         frame - Page bytes that should be displayed
+
+      Returns a list of (start, end) column spans that differ.  Spans separated
+      by less than SPAN_MERGE_GAP unchanged columns are merged, as re-sending a
+      few unchanged bytes is cheaper than another cursor move.
+    """
+
+    def __changedSpans(self, shadow, frame):
+        spans = []
+        col = 0
+        while col < self.COLUMNS:
+            if shadow[col] == frame[col]:
+                col += 1
+                continue
+            start = col
+            end = col + 1
+            col += 1
+            while col < self.COLUMNS and col - end < self.SPAN_MERGE_GAP:
+                if shadow[col] != frame[col]:
+                    end = col + 1
+                col += 1
+            spans.append((start, end))
+        return spans
 
     """
      setCursorPosition(row,col)
@@ -214,6 +334,10 @@ class SH1106LCD:
     """
 
     def setCursorPosition(self, row, col):
+        with self.commandBatch():
+            self.__setCursorPosition(row, col)
+
+    def __setCursorPosition(self, row, col):
         # Set row
         page = 0xB0 + row
         self.__sendCommand(page)
@@ -231,6 +355,60 @@ class SH1106LCD:
         self.__sendCommand(upperColumnOffsetByte)  # Upper 4 bits
         self.__sendCommand(lowerColumnOffsetByte)  # Lower 4 bits
 
+    """
+     commandBatch()
+
+      Context manager coalescing every command sent inside it into as few
+      transfers as possible.  Commands are queued and sent on exit in one
+      write_i2c_block_data per maxBlockSize commands, prefixed by a control
+      byte with the Co bit cleared.  Nested batches are sent by the outermost one.
+
+        with lcd.commandBatch():
+            ...
+    """
+
+    @contextmanager
+    def commandBatch(self):
+        if self.__commandQueue is not None:
+            yield
+            return
+        self.__commandQueue = []
+        try:
+            yield
+        finally:
+            commands, self.__commandQueue = self.__commandQueue, None
+            for chunk in self.__chunks(commands, self.maxBlockSize):
+                self.__sendCommands(chunk)
+
+    """
+     __writeAt(page, column, data)
+
+         page - The page to write to (0 - 7)
+         column - The raw Display Data Ram column of the first byte (0 - 131)
+         data - Bytestream to send to the Display Data RAM.
+
+      Sets the cursor and sends data in a single transfer: the three cursor
+      commands are each preceded by a control byte with the Co bit set, then
+      a data control byte introduces as much data as fits.  Data that does not
+      fit follows in plain data transfers.
+    """
+
+    def __writeAt(self, page, column, data):
+        head = self.maxBlockSize - 6
+        self.__sendCommandData(
+            [
+                0xB0 + page,
+                self.OLED_Command_Mode,
+                (column >> 4) + 0x10,
+                self.OLED_Command_Mode,
+                column & 0x0F,
+                self.OLED_Data_Mode,
+            ]
+            + list(data[:head])
+        )
+        if len(data) > head:
+            self.__sendDataBlock(data[head:])
+
     """
      __sendCommand(command)
 
@@ -243,6 +421,9 @@ class SH1106LCD:
     """
 
     def __sendCommand(self, command):
+        if self.__commandQueue is not None:
+            self.__commandQueue.append(command)
+            return
         retries = 10
         error = None
         while retries > 0:
@@ -256,6 +437,49 @@ class SH1106LCD:
             else:
                 break
 
+    """
+     __sendCommands(commands)
+
+     	commands - Up to maxBlockSize commands to send in one transfer
+    """
+
+    def __sendCommands(self, commands):
+        retries = 10
+        error = None
+        while retries > 0:
+            try:
+                self.bus.write_i2c_block_data(
+                    self.OLED_Address, self.OLED_Command_Stream, commands
+                )
+            except IOError as e:
+                error = e
+                retries -= 1
+            else:
+                break
+
+    """
+     __sendCommandData(data)
+
+     	data - Command bytes followed by display data, see __writeAt
+
+     The first command byte is introduced by the register byte, a command
+     control byte with the Co bit set.
+    """
+
+    def __sendCommandData(self, data):
+        retries = 10
+        error = None
+        while retries > 0:
+            try:
+                self.bus.write_i2c_block_data(
+                    self.OLED_Address, self.OLED_Command_Mode, data
+                )
+            except IOError as e:
+                error = e
+                retries -= 1
+            else:
+                break
+
     """
      __sendDataByte(dataByte)
 
@@ -279,6 +503,8 @@ class SH1106LCD:
                 break
 
     def sendDataByte(self, dataByte):
+        # Bypasses the frame buffer, panel content is no longer known.
+        self.__panel = None
         self.__sendDataByte(dataByte)
 
     """
@@ -301,7 +527,21 @@ class SH1106LCD:
             else:
                 break
 
+    """
+    __sendDataBlock(data)
+
+        data - Bytestream of any length to send to the Display Data RAM.
+
+    Splits data into the largest transfers the bus accepts (maxBlockSize).
+    """
+
+    def __sendDataBlock(self, data):
+        for chunk in self.__chunks(data, self.maxBlockSize):
+            self.__sendData(list(chunk))
+
     def sendData(self, data):
+        # Bypasses the frame buffer, panel content is no longer known.
+        self.__panel = None
         self.__sendData(data)
 
     """
@@ -324,11 +564,26 @@ class SH1106LCD:
 
     Processes an image and adds it to the internal buffer.  This pre-processes the image
     before storing it and avoids unnecessary processing each time you wish to display it.
+    Processed images are also kept in the on-disk image cache, so later starts load the
+    packed pages instead of decoding the file again.
 
     """
 
     def addImage(self, imageID, filename):
-        processedImage = self.LCDImage(filename)
+        cached = None
+        if self.imageCache is not None:
+            cached = self.imageCache.load(filename)
+        if cached is not None:
+            processedImage = self.LCDImage.fromPages(*cached)
+        else:
+            processedImage = self.LCDImage(filename)
+            if self.imageCache is not None and processedImage.data:
+                self.imageCache.store(
+                    filename,
+                    processedImage.width,
+                    processedImage.height,
+                    processedImage.data,
+                )
         self.imageBuffer[imageID] = processedImage
 
     """
@@ -371,52 +626,33 @@ class SH1106LCD:
     def displayStringNumber(self, inString, row, col, wrap=None):
         if wrap is None:
             wrap = False
-        displayStringNumber = inString
-        # Set the row/column position
-        self.setCursorPosition(row, col)
-        for c in displayStringNumber:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            self.__sendData(self.fontNumber[fontIndex])
-            self.__sendDataByte(0x00)
-        self.setCursorPosition(row + 1, col)
-        for c in displayStringNumber:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            self.__sendData(self.fontNumber1[fontIndex])
-            self.__sendDataByte(0x00)
+        self.__drawText(inString, row, col, "number")
 
     def displayStringLine1(self, inString, row, col, wrap=None):
         if wrap is None:
             wrap = False
-        displayStringLine1 = inString
-        # Set the row/column position
-        self.setCursorPosition(row, col)
-        for c in displayStringLine1:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            self.__sendData(self.fontLine1[fontIndex])
-            self.__sendDataByte(0x00)
+        self.__drawText(inString, row, col, "line1")
 
     def displayString(self, inString, row, col, wrap=None):
         if wrap is None:
             wrap = False
         # Convert string to all caps as lower case characters are not implemented in the font.
         # displayString = str(inString).upper()
-        displayString = inString
-        # Set the row/column position
-        self.setCursorPosition(row, col)
-        for c in displayString:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            self.__sendData(self.font[fontIndex])
-            self.__sendDataByte(0x00)
-        self.setCursorPosition(row + 1, col)
-        for c in displayString:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            self.__sendData(self.font1[fontIndex])
-            self.__sendDataByte(0x00)
+        return self.__drawText(inString, row, col, "cap")
+
+    """
+    displayColumns(data, row, col)
+
+        data - Column bytes, bit D0 being the top pixel of the row
+        row - Row (page) to draw on (0 - 7)
+        col - Column of the first byte
+
+    Draws raw column bytes, e.g. a pre-rendered strip.  Anything past the
+    last column is clipped.  Returns the column following the data.
+    """
+
+    def displayColumns(self, data, row, col):
+        return self.__drawBytes(row, col, data)
 
     """
     centerString(inString, row)
@@ -438,26 +674,86 @@ class SH1106LCD:
     def displayInvertedString(self, inString, row, col):
         # Convert string to all caps as lower case characters are not implemented in the font.
         # displayString = str(inString).upper()
-        displayString = inString
-        # Set the row/column position
-        self.setCursorPosition(row, col)
-        for c in displayString:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            bytestream = self.font[fontIndex]
-            for b in bytestream:
-                # invert the byte and send it
-                self.__sendDataByte(b ^ 0xFF)
-            self.__sendDataByte(0xFF)
-        self.setCursorPosition(row + 1, col)
-        for c in displayString:
-            # Get the ascii value and then subtract 32 as the font does not have any characters before the 32nd implemented.
-            fontIndex = ord(c) - 32
-            bytestream = self.font1[fontIndex]
-            for b in bytestream:
-                # invert the byte and send it
-                self.__sendDataByte(b ^ 0xFF)
-            self.__sendDataByte(0xFF)
+        return self.__drawText(inString, row, col, "cap", inverted=True)
+
+    """
+    composeLine(inString, font, inverted)
+
+        inString - Text to render
+        font - FontAtlas for a single page (e.g. self.fonts["cap"][0])
+        inverted - Render white background with black text
+
+    Composes the column bytes of a whole string for one page, including the
+    one column spacer after every glyph, into a single contiguous buffer.
+    Characters missing from the font are drawn with its fallback glyph.
+    """
+
+    def composeLine(self, inString, font, inverted=False):
+        return font.compose(str(inString), inverted)
+
+    """
+    renderText(inString, fontName, inverted)
+
+        fontName - Key of self.fonts ("cap", "number" or "line1")
+
+    Returns a tuple with the composed bytes of every page the string spans.
+    Results are kept in an LRU cache of at most textCacheSize entries keyed by
+    (text, font, inverted), textCacheHits/textCacheMisses count its lookups.
+    """
+
+    def renderText(self, inString, fontName, inverted=False):
+        key = (str(inString), fontName, inverted)
+        pages = self.__textCache.get(key)
+        if pages is not None:
+            self.textCacheHits += 1
+            self.__textCache.move_to_end(key)
+            return pages
+        self.textCacheMisses += 1
+        pages = tuple(
+            self.composeLine(key[0], font, inverted) for font in self.fonts[fontName]
+        )
+        if self.textCacheSize > 0:
+            self.__textCache[key] = pages
+            while len(self.__textCache) > self.textCacheSize:
+                self.__textCache.popitem(last=False)
+        return pages
+
+    def clearTextCache(self):
+        self.__textCache.clear()
+        self.textCacheHits = 0
+        self.textCacheMisses = 0
+
+    """
+    __drawText(inString, row, col, fontName, inverted)
+
+    Renders the string with renderText and places every page into the frame buffer.
+    Returns the column following the text.
+    """
+
+    def __drawText(self, inString, row, col, fontName, inverted=False):
+        end = col
+        for i, page in enumerate(self.renderText(inString, fontName, inverted)):
+            end = max(end, self.__drawBytes(row + i, col, page))
+        return end
+
+    """
+    __drawBytes(row, col, data)
+
+        row - Row (page) to draw on (0 - 7)
+        col - Column of the first byte, same numbering as setCursorPosition
+        data - Column bytes to place into the frame buffer
+
+    Copies data into the frame buffer, clipping anything past the last column.
+    Returns the column following the last byte, like the LCD cursor would.
+    """
+
+    def __drawBytes(self, row, col, data):
+        start = col + self.COLUMN_OFFSET
+        end = min(start + len(data), self.COLUMNS)
+        if start < end:
+            self.frameBuffer[row][start:end] = bytes(data[: end - start])
+            self.__dirtyPages.add(row)
+        return col + len(data)
 
     """
     __displayProcessedImage(self, processedImage, row, col)
@@ -473,9 +769,7 @@ class SH1106LCD:
     def __displayProcessedImage(self, processedImage, row, col):
         try:
             # Ensure the picture will fit with the given column and row starting points.
-            if (processedImage.width + col > 132) or (
-                processedImage.height / 8 + row > 8
-            ):
+            if (processedImage.width + col > 132) or (processedImage.pages + row > 8):
                 raise ValueError(
                     "Picture is too large to fit on the screen with the supplied row/column: Width "
                     + str(processedImage.width)
@@ -485,21 +779,9 @@ class SH1106LCD:
             # Get the raw data from the processed image
             imageData = processedImage.data
 
-            # Display the image
-            for i in range(row, 8):
-                self.setCursorPosition(row, col)
-                # Set column
-                page = 0xB0 + i
-                self.__sendCommand(page)
-                # The i2c bus can only take a maximum of 32 bytes of data at a time.  If the image is more than 32 pixels
-                # wide we need to break it into chunks.
-                stream = imageData[i]
-                if len(stream) > 32:
-                    splitStream = self.__chunks(list(stream), 32)
-                    for chunk in splitStream:
-                        self.__sendData(chunk)
-                else:
-                    self.__sendData(stream)
+            # Copy the image into the frame buffer, one page at a time
+            for i, stream in enumerate(imageData):
+                self.__drawBytes(row + i, col, stream)
 
         except ValueError as e:
             print("Value Error: ")
@@ -526,26 +808,46 @@ class SH1106LCD:
         def __init__(self, filename):
             self.width = 0
             self.height = 0
+            self.pages = 0
             self.data = self.processPicture(filename)
 
+        """
+         fromPages(width, height, data)
+
+          Creates an LCDImage from already packed pages, e.g. loaded from the image cache.
+        """
+
+        @classmethod
+        def fromPages(cls, width, height, data):
+            image = cls.__new__(cls)
+            image.width = width
+            image.height = height
+            image.pages = len(data)
+            image.data = data
+            return image
+
         """
          processPicture(filename)
 
-             filename - The bitmap file to import.
+             filename - The image file to import.
 
-          Imports a monocrhome bitmap file and converts it into a format
-          that can be displayed on the LCD.  The black pixels of the
-          bitmap will be read as "ON", and white as "OFF" effectively
-          reversing the colors on the actual LCD.
-          *The bitmap cannot be larger than 132 pixels wide or 64 pixels
+          Imports an image file and converts it into a format that can
+          be displayed on the LCD.  Light pixels (value 128 or above once
+          converted to grayscale) of the image will be read as "ON", dark
+          pixels as "OFF".  A monochrome bitmap is displayed as drawn.
+          *The image cannot be larger than 132 pixels wide or 64 pixels
            tall.
-          *The bitmap's height must be divisible by 8.
+          *If the height is not divisible by 8 the last page is padded
+           with "OFF" pixels.
 
-             Returns - a (list of lists) that can be passed into
-                 the displayImage(filename)
+             Returns - a list with the column bytes of every page, ready
+                 to be sent to the Display Data RAM.
         """
 
         def processPicture(self, filename):
+            # PIL is only loaded when an image has to be decoded
+            from PIL import Image
+
             output = []
             try:
                 picture = Image.open(filename)
@@ -556,43 +858,16 @@ class SH1106LCD:
                         "Picture is larger than the allowable 132x64 pixels."
                     )
 
-                # Ensure image file height is divisible by 8
-                # TODO - Should probably just change logic below to properly handle this case.  Don't need it for now.
-                if height % 8 != 0:
-                    raise ValueError("Picture height is not divisible by 8.")
-
                 # Properly set the width/height class variables
                 self.width = width
                 self.height = height
+                self.pages = (height + 7) // 8
 
-                # Read in the picture as a bitstream.
-                bits = list(picture.getdata())
-
-                # Convert stream of pixels to width x height array
-                matrix = []
-                for i in range(height):
-                    temp = []
-                    for j in range(width):
-                        temp.append(bits[i * width + j])
-                    matrix.append(temp)
-
-                # Convert width x height array to
-
-                for i in range(height / 8):
-                    temp = []
-                    for j in range(width):
-                        bit0 = matrix[i * 8][j] / 255
-                        bit1 = 2 * (matrix[i * 8 + 1][j] / 255)
-                        bit2 = 4 * (matrix[i * 8 + 2][j] / 255)
-                        bit3 = 8 * (matrix[i * 8 + 3][j] / 255)
-                        bit4 = 16 * (matrix[i * 8 + 4][j] / 255)
-                        bit5 = 32 * (matrix[i * 8 + 5][j] / 255)
-                        bit6 = 64 * (matrix[i * 8 + 6][j] / 255)
-                        bit7 = 128 * (matrix[i * 8 + 7][j] / 255)
-                        temp.append(
-                            bit0 + bit1 + bit2 + bit3 + bit4 + bit5 + bit6 + bit7
-                        )
-                    output.append(temp)
+                # One byte per pixel, 0 for "OFF" and 1 for "ON", padded to whole pages.
+                pixels = picture.convert("L").tobytes().translate(PIXEL_TABLE)
+                pixels += bytes(width * (self.pages * 8 - height))
+
+                output = self.packPages(pixels, width, self.pages)
 
             except IOError as e:
                 print("I/O error: Could no open file: " + filename)
@@ -602,3 +877,39 @@ class SH1106LCD:
                 traceback.print_exc()
 
             return output
+
+        """
+         packPages(pixels, width, pages)
+
+             pixels - Row major bytes, one per pixel, each 0 or 1
+             width - Pixels per row
+             pages - Number of pages, pixels holds pages * 8 rows
+
+          Packs every 8 rows into one page of column bytes, the top row of a
+          page becoming bit D0.  Uses NumPy when it is installed, otherwise
+          every row is turned into one big integer holding its bit for all
+          columns, so a page is packed with eight OR operations.
+        """
+
+        @staticmethod
+        def packPages(pixels, width, pages):
+            # NumPy is only loaded when an image has to be packed
+            try:
+                import numpy
+            except ImportError:
+                numpy = None
+
+            if numpy is not None:
+                matrix = numpy.frombuffer(pixels, dtype=numpy.uint8)
+                matrix = matrix.reshape(pages, 8, width)
+                packed = numpy.packbits(matrix, axis=1, bitorder="little")
+                return [page.tobytes() for page in packed.reshape(pages, width)]
+            output = []
+            for page in range(pages):
+                packed = 0
+                for bit in range(8):
+                    start = (page * 8 + bit) * width
+                    row = pixels[start : start + width].translate(BIT_TABLES[bit])
+                    packed |= int.from_bytes(row, "big")
+                output.append(packed.to_bytes(width, "big"))
+            return output
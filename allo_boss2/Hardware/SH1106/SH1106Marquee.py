@@ -0,0 +1,101 @@
+"""
+  Class Marquee(lcd, inString, row, col, width, fontName, gap, step, pauseTicks)
+
+      lcd - SH1106LCD to draw on
+      inString - Text to show
+      row - Top row (page) of the text
+      col - First column of the window, same numbering as setCursorPosition
+      width - Columns of the window, 128 for the whole line
+      fontName - Key of lcd.fonts, "line1" scrolls a single page
+      gap - Blank columns between the end of the text and its next start
+      step - Columns scrolled per tick
+      pauseTicks - Ticks the start of the text stays still before scrolling
+
+  Horizontally scrolling text.  The whole string is rendered once into a
+  strip of column bytes followed by the gap and, again, the first width
+  columns, so any window position is a single contiguous slice.  Every
+  tick() copies the next window into the frame buffer of the LCD, the
+  following flush() then transmits only the changed columns of its pages.
+  Text that fits the window is drawn once and does not scroll.
+"""
+
+
+class Marquee:
+    def __init__(
+        self,
+        lcd,
+        inString,
+        row,
+        col=0,
+        width=128,
+        fontName="line1",
+        gap=24,
+        step=1,
+        pauseTicks=20,
+    ):
+        self.lcd = lcd
+        self.text = str(inString)
+        self.row = row
+        self.col = col
+        self.width = width
+        self.step = step
+        self.pauseTicks = pauseTicks
+
+        pages = lcd.renderText(self.text, fontName)
+        textWidth = max(len(page) for page in pages)
+        self.scrolling = textWidth > width
+        if self.scrolling:
+            # One scroll cycle, after which the window shows the start again
+            self.period = textWidth + gap
+            self.strip = [
+                page.ljust(self.period, b"\x00") + page[:width] for page in pages
+            ]
+        else:
+            self.period = 0
+            self.strip = [page.ljust(width, b"\x00") for page in pages]
+        self.offset = 0
+        self.pause = pauseTicks
+
+    """
+     draw()
+
+      Copies the window at the current offset into the frame buffer.
+    """
+
+    def draw(self):
+        for i, page in enumerate(self.strip):
+            self.lcd.displayColumns(
+                page[self.offset : self.offset + self.width], self.row + i, self.col
+            )
+
+    """
+     tick()
+
+      Advances the text by step columns and draws it.  Returns True when a
+      scroll cycle was completed, the start of the text being shown again.
+    """
+
+    def tick(self):
+        if not self.scrolling:
+            return False
+        if self.pause > 0:
+            self.pause -= 1
+            return False
+        self.offset += self.step
+        wrapped = self.offset >= self.period
+        if wrapped:
+            self.offset = 0
+            self.pause = self.pauseTicks
+        self.draw()
+        return wrapped
+
+    """
+     reset()
+
+      Shows the start of the text again and restarts the pause.
+    """
+
+    def reset(self):
+        self.offset = 0
+        self.pause = self.pauseTicks
+        self.draw()
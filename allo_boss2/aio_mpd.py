@@ -0,0 +1,321 @@
+import asyncio
+from typing import Callable, List, Optional, Sequence, Tuple
+
+BACKOFF_MIN = 1
+BACKOFF_MAX = 30
+
+
+class MPDError(Exception):
+    pass
+
+
+class CommandError(MPDError):
+    """
+    An ACK reply. In a command list index is the position of the failed
+    command and results holds the replies of the commands before it.
+    """
+
+    def __init__(self, message, index=0, results=None):
+        super().__init__(message)
+        self.index = index
+        self.results = results or []
+
+
+class ClosedBeforeReply(ConnectionResetError):
+    """
+    The connection was found closed before a single reply byte arrived,
+    e.g. MPD dropped it after its connection_timeout. The request was not
+    run and can be sent again on a new connection.
+    """
+
+
+def quote(arg) -> str:
+    arg = str(arg).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{arg}"'
+
+
+def format_command(name: str, args: Sequence = ()) -> bytes:
+    return " ".join([name] + [quote(arg) for arg in args]).encode() + b"\n"
+
+
+def parse_pairs(lines: List[str]) -> dict:
+    """ "key: value" lines to a dict, repeated keys (tags) become lists."""
+    result = {}
+    for line in lines:
+        key, _, value = line.partition(": ")
+        key = key.lower()
+        if key in result:
+            if not isinstance(result[key], list):
+                result[key] = [result[key]]
+            result[key].append(value)
+        else:
+            result[key] = value
+    return result
+
+
+class MPDConnection:
+    """
+    A single connection speaking the MPD text protocol over asyncio
+    streams. Requests are serialized, several commands are sent in one
+    round trip with command_list().
+    """
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.version = None
+        self.lock = asyncio.Lock()
+        # whether any byte of the reply to the current request was read
+        self.replied = False
+
+    async def open(self, host: str, port: int):
+        if host.startswith("/"):
+            self.reader, self.writer = await asyncio.open_unix_connection(host)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(host, port)
+        hello = await self._readline()
+        if not hello.startswith("OK MPD "):
+            raise MPDError(f"Unexpected greeting {hello!r}")
+        self.version = hello[len("OK MPD ") :]
+
+    @property
+    def connected(self) -> bool:
+        # MPD closing the connection only shows as EOF on the reader
+        return (
+            self.writer is not None
+            and not self.writer.is_closing()
+            and not self.reader.at_eof()
+        )
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = None
+        self.reader = None
+
+    async def _send(self, request: bytes):
+        self.replied = False
+        try:
+            self.writer.write(request)
+            await self.writer.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise ClosedBeforeReply(f"MPD closed the connection: {e!r}") from None
+
+    async def _readline(self) -> str:
+        line = await self.reader.readline()
+        if not line.endswith(b"\n"):
+            if not line and not self.replied:
+                raise ClosedBeforeReply("MPD closed the connection")
+            raise ConnectionResetError("MPD closed the connection")
+        self.replied = True
+        return line[:-1].decode("utf-8", "replace")
+
+    async def _read_reply(self, end: str) -> List[str]:
+        lines = []
+        while True:
+            line = await self._readline()
+            if line == end or line == "OK":
+                return lines
+            if line.startswith("ACK "):
+                raise CommandError(line[4:])
+            lines.append(line)
+
+    async def command(self, name: str, *args) -> dict:
+        async with self.lock:
+            await self._send(format_command(name, args))
+            return parse_pairs(await self._read_reply("OK"))
+
+    async def command_list(
+        self, commands: Sequence[Tuple[str, Sequence]]
+    ) -> List[dict]:
+        """Sends all commands at once and returns the reply of each."""
+        async with self.lock:
+            request = [b"command_list_ok_begin\n"]
+            request += [format_command(name, args) for name, args in commands]
+            request.append(b"command_list_end\n")
+            await self._send(b"".join(request))
+            results = []
+            for _ in commands:
+                try:
+                    results.append(parse_pairs(await self._read_reply("list_OK")))
+                except CommandError as e:
+                    # MPD skips the rest of the list after an error
+                    raise CommandError(str(e), len(results), results) from None
+            # the final OK
+            await self._read_reply("OK")
+            return results
+
+    async def idle(self, subsystems: Sequence[str]) -> List[str]:
+        """Waits, without a timeout, until one of the subsystems changes."""
+        async with self.lock:
+            await self._send(format_command("idle", subsystems))
+            lines = await self._read_reply("OK")
+        return [line.partition(": ")[2] for line in lines]
+
+
+class AsyncMPDClient:
+    """
+    asyncio MPD client keeping two connections: one for commands and a
+    separate long lived one for idle notifications, so waiting for events
+    never delays a command.
+
+    submit() queues a command and returns at once. Commands queued while
+    another request is in flight are sent together in one command list.
+    Every request has a timeout, and after a failed connect no new one is
+    attempted before an exponential backoff has passed, commands fail
+    right away meanwhile. A slow or missing MPD therefore never blocks the
+    caller, e.g. the volume handling on the same event loop.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 6600, timeout: float = 3):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.connection: Optional[MPDConnection] = None
+        self.idle_connection: Optional[MPDConnection] = None
+        self.pending = []
+        self.sender = None
+        self.backoff = BACKOFF_MIN
+        self.retry_at = 0.0
+
+    async def _connect(self) -> MPDConnection:
+        connection = MPDConnection()
+        try:
+            await asyncio.wait_for(connection.open(self.host, self.port), self.timeout)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def _command_connection(self) -> MPDConnection:
+        if self.connection is not None and self.connection.connected:
+            return self.connection
+        loop = asyncio.get_running_loop()
+        if loop.time() < self.retry_at:
+            raise MPDError("MPD unavailable, waiting before reconnecting")
+        try:
+            self.connection = await self._connect()
+        except (OSError, MPDError, asyncio.TimeoutError):
+            self.retry_at = loop.time() + self.backoff
+            self.backoff = min(self.backoff * 2, BACKOFF_MAX)
+            raise
+        self.backoff = BACKOFF_MIN
+        return self.connection
+
+    def _drop_connection(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def submit(self, name: str, *args) -> asyncio.Future:
+        """Queues a command, the future resolves to its reply."""
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_report_error)
+        self.pending.append((name, args, future))
+        if self.sender is None or self.sender.done():
+            self.sender = asyncio.ensure_future(self._send_pending())
+        return future
+
+    async def command(self, name: str, *args) -> dict:
+        return await self.submit(name, *args)
+
+    async def _request(self, batch) -> List[dict]:
+        for retry in (True, False):
+            connection = await self._command_connection()
+            try:
+                if len(batch) == 1:
+                    name, args, _ = batch[0]
+                    return [
+                        await asyncio.wait_for(
+                            connection.command(name, *args), self.timeout
+                        )
+                    ]
+                return await asyncio.wait_for(
+                    connection.command_list([(n, a) for n, a, _ in batch]),
+                    self.timeout,
+                )
+            except ClosedBeforeReply:
+                # nothing was run, e.g. MPD closed the connection after a
+                # quiet minute, send it once more on a new connection
+                self._drop_connection()
+                if not retry:
+                    raise
+
+    async def _send_pending(self):
+        while self.pending:
+            batch, self.pending = self.pending, []
+            try:
+                results = await self._request(batch)
+            except CommandError as e:
+                for i, (_, _, future) in enumerate(batch):
+                    if i < e.index:
+                        future.set_result(e.results[i])
+                    elif i == e.index:
+                        future.set_exception(e)
+                    else:
+                        future.set_exception(MPDError("Skipped after an error"))
+            except (OSError, MPDError, asyncio.TimeoutError) as e:
+                # the reply may still arrive, the connection can't be reused
+                self._drop_connection()
+                for _, _, future in batch:
+                    future.set_exception(MPDError(f"MPD command failed: {e!r}"))
+            else:
+                for (_, _, future), result in zip(batch, results):
+                    future.set_result(result)
+
+    async def idle(
+        self,
+        subsystems: Sequence[str],
+        on_connection: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Async generator yielding the list of changed subsystems, forever.
+        After every (re)connect all subsystems are reported as changed.
+        While the consumer handles a yield the idle connection is free
+        for queries through idle_command_list().
+        """
+        backoff = BACKOFF_MIN
+        while True:
+            try:
+                self.idle_connection = await self._connect()
+                if on_connection is not None:
+                    on_connection(True)
+                backoff = BACKOFF_MIN
+                changed = list(subsystems)
+                while True:
+                    yield changed
+                    if not self.idle_connection.connected:
+                        # closed by a failed idle_command_list()
+                        raise ConnectionResetError("MPD idle connection closed")
+                    changed = await self.idle_connection.idle(subsystems)
+            except (OSError, MPDError, asyncio.TimeoutError) as e:
+                print(f"MPD idle connection lost: {e!r}")
+            finally:
+                if self.idle_connection is not None:
+                    self.idle_connection.close()
+                    self.idle_connection = None
+                    if on_connection is not None:
+                        on_connection(False)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, BACKOFF_MAX)
+
+    async def idle_command_list(self, commands: Sequence[Tuple[str, Sequence]]):
+        try:
+            return await asyncio.wait_for(
+                self.idle_connection.command_list(commands), self.timeout
+            )
+        except BaseException:
+            # a reply cancelled halfway would be read by the next request,
+            # idle() reconnects and reports every subsystem as changed
+            self.idle_connection.close()
+            raise
+
+    def close(self):
+        self._drop_connection()
+        if self.idle_connection is not None:
+            self.idle_connection.close()
+
+
+def _report_error(future: asyncio.Future):
+    if not future.cancelled() and future.exception() is not None:
+        print(future.exception())
@@ -0,0 +1,252 @@
+import asyncio
+import time
+
+from allo_boss2.boss2_oled import (
+    MARQUEE_FPS,
+    OLED,
+    REMOTE_CTRL,
+    SCREEN_OFF_AFTER,
+    SOUND_CTRL,
+    setup_buttons,
+)
+from allo_boss2.hw_params import HwParamsReader
+from allo_boss2.input_watcher import InputDeviceWatcher
+from allo_boss2.aio_mpd import AsyncMPDClient, MPDError
+from allo_boss2.now_playing import NowPlaying
+from allo_boss2.stream_watcher import StreamWatcher
+
+# Seconds before a failed task is restarted, doubled on every failure
+# in a row up to RESTART_MAX
+RESTART_MIN = 1
+RESTART_MAX = 30
+
+
+class AsyncRuntime:
+    """
+    Runs every input of the daemon on one asyncio event loop instead of a
+    thread per input: the IR remote, the GPIO buttons, the ALSA mixer
+    descriptors, MPD idle notifications, stream format rereads, the elapsed
+    time of the now playing screen and the screen off timer. OLED drawing
+    only marks the display dirty, a single display task writes the
+    framebuffer to the panel, so nothing else ever touches the bus and the
+    OLED lock is never contended.
+    """
+
+    def __init__(
+        self, sound_ctrl: SOUND_CTRL, lcd: OLED, remote: REMOTE_CTRL, ir_devices
+    ):
+        self.sound_ctrl = sound_ctrl
+        self.lcd = lcd
+        self.remote = remote
+        self.ir_devices = ir_devices
+        self.loop = None
+        self.dirty = None
+        self.activity = None
+        self.stream_triggered = None
+        self.now_playing_changed = None
+        self.scroll_started = None
+        self.mpd_connected = False
+        self.stream_reader = HwParamsReader(sound_ctrl.card_num)
+        self.stream = None
+        self.mpd = AsyncMPDClient("localhost", 6600)
+
+    def _threadsafe(self, callback, *args):
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def mark_dirty(self):
+        # may be called off the loop, e.g. from a gpiozero thread
+        self._threadsafe(self.dirty.set)
+
+    def mark_activity(self):
+        self._threadsafe(self.activity.set)
+
+    def trigger_stream(self):
+        self.stream_triggered.set()
+
+    async def display_task(self):
+        while True:
+            await self.dirty.wait()
+            self.dirty.clear()
+            self.lcd.oled.flush()
+
+    async def screen_off_task(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.activity.wait(), SCREEN_OFF_AFTER)
+            except asyncio.TimeoutError:
+                self.lcd.screen_off()
+                await self.activity.wait()
+                self.lcd.screen_on()
+            self.activity.clear()
+
+    async def ir_task(self):
+        # the InputDeviceWatcher hands over the device once it exists
+        ir_device = await self.loop.run_in_executor(None, self.ir_devices.get)
+        try:
+            async for event in ir_device.async_read_loop():
+                self.remote.handle_event(event)
+        except OSError:
+            # the receiver is gone, watch for it to come back, the
+            # restarted task waits for it again
+            ir_device.close()
+            InputDeviceWatcher(ir_device.name, self.ir_devices.put).start()
+            raise
+
+    def _mixer_event(self):
+        self.sound_ctrl.mixer.handle_events()
+        self.sound_ctrl.hctl.handle_events()
+        self.lcd.mixer_changed()
+        self.trigger_stream()
+
+    def watch_mixer(self):
+        fds = {fd for fd, events in self.sound_ctrl.mixer.poll_fds}
+        fds.update(fd for fd, events in self.sound_ctrl.hctl.poll_fds)
+        for fd in fds:
+            self.loop.add_reader(fd, self._mixer_event)
+
+    def _network_event(self):
+        if self.lcd.network.handle_events():
+            self.lcd.address_lines()
+
+    def _update_stream(self):
+        stream = self.stream_reader.read()
+        if stream != self.stream:
+            self.stream = stream
+            self.lcd.hw_line(stream)
+
+    async def stream_task(self):
+        self._update_stream()
+        while True:
+            # poll like StreamWatcher does, slowly while MPD events trigger
+            # rereads, other players open the PCM without any event
+            if self.mpd_connected:
+                timeout = StreamWatcher.SLOW_POLL_INTERVAL
+            else:
+                timeout = 3
+            try:
+                await asyncio.wait_for(self.stream_triggered.wait(), timeout)
+            except asyncio.TimeoutError:
+                self._update_stream()
+                continue
+            self.stream_triggered.clear()
+            start = self.loop.time()
+            for delay in StreamWatcher.REREAD_DELAYS:
+                await asyncio.sleep(max(0.0, start + delay - self.loop.time()))
+                self._update_stream()
+
+    def set_now_playing(self, now_playing: NowPlaying):
+        self.lcd.now_playing = now_playing
+        self.now_playing_changed.set()
+        self.lcd.now_playing_lines()
+
+    async def elapsed_task(self):
+        # ElapsedTicker on the loop
+        while True:
+            delay = self.lcd.now_playing.next_second()
+            try:
+                await asyncio.wait_for(
+                    self.now_playing_changed.wait(),
+                    None if delay is None else delay + 0.01,
+                )
+                self.now_playing_changed.clear()
+            except asyncio.TimeoutError:
+                self.lcd.elapsed_line()
+
+    async def marquee_task(self):
+        # AnimationTicker on the loop
+        frame_time = 1.0 / MARQUEE_FPS
+        while True:
+            await self.scroll_started.wait()
+            self.scroll_started.clear()
+            while self.lcd.scrolling():
+                self.lcd.marquee_tick()
+                await asyncio.sleep(frame_time)
+
+    def mpd_connection(self, connected: bool):
+        self.mpd_connected = connected
+        self.trigger_stream()
+        if not connected:
+            self.set_now_playing(NowPlaying())
+
+    async def read_now_playing(self):
+        # status and currentsong in one round trip
+        status, song = await self.mpd.idle_command_list(
+            [("status", ()), ("currentsong", ())]
+        )
+        self.set_now_playing(NowPlaying.from_mpd(status, song, time.monotonic()))
+
+    async def mpd_idle_task(self):
+        async for changed in self.mpd.idle(
+            ["player", "mixer", "options"], self.mpd_connection
+        ):
+            if "player" in changed:
+                self.trigger_stream()
+            try:
+                await self.read_now_playing()
+            except (OSError, MPDError, asyncio.TimeoutError) as e:
+                # the idle connection was closed, idle() reconnects
+                print(f"Reading MPD status failed: {e!r}")
+
+    async def supervise(self, task):
+        """
+        Runs task() forever. When it fails, or returns, the error is logged
+        and it is restarted after a backoff, the other tasks keep running
+        like the other threads of the threads runtime do.
+        """
+        backoff = RESTART_MIN
+        while True:
+            started = self.loop.time()
+            try:
+                await task()
+                print(f"{task.__name__} ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"{task.__name__} failed: {e!r}")
+            if self.loop.time() - started > RESTART_MAX:
+                # ran fine for a while, not failing in a row
+                backoff = RESTART_MIN
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RESTART_MAX)
+
+    async def main(self):
+        self.loop = asyncio.get_running_loop()
+        self.dirty = asyncio.Event()
+        self.activity = asyncio.Event()
+        self.stream_triggered = asyncio.Event()
+        self.now_playing_changed = asyncio.Event()
+        self.scroll_started = asyncio.Event()
+
+        self.lcd.flush_callback = self.mark_dirty
+        self.lcd.activity_callback = self.mark_activity
+        self.lcd.scroll_callback = lambda: self._threadsafe(self.scroll_started.set)
+        # fire and forget, a slow MPD never holds up the remote
+        self.remote.mpd_submit = self.mpd.submit
+
+        tasks = [
+            self.display_task,
+            self.screen_off_task,
+            self.stream_task,
+            self.mpd_idle_task,
+            self.elapsed_task,
+            self.marquee_task,
+            self.ir_task,
+        ]
+
+        self.lcd.volume_screen()
+        self.watch_mixer()
+        if self.lcd.network is not None:
+            self.loop.add_reader(self.lcd.network.fileno(), self._network_event)
+        # gpiozero calls back from its own thread, hand the press to the loop
+        buttons = setup_buttons(
+            lambda btn: self._threadsafe(self.lcd.button_callback, btn)
+        )
+        try:
+            await asyncio.gather(*(self.supervise(task) for task in tasks))
+        finally:
+            for btn in buttons:
+                btn.close()
+
+
+def run_asyncio(sound_ctrl: SOUND_CTRL, lcd: OLED, remote: REMOTE_CTRL, ir_devices):
+    asyncio.run(AsyncRuntime(sound_ctrl, lcd, remote, ir_devices).main())
@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+"""
+SPDX-License-Identifier: GPL-3.0-or-later
+Copyright 2024 tomaxsas@gmail.com
+
+Render benchmark for the OLED screens.
+
+Drives every screen and every button press of every screen against a
+RecordingBus instead of the real I2C bus and reports, per case, the I2C
+transactions and bytes emitted, the wall time of the Python side and the
+time the traffic would occupy the bus at the given I2C clocks.  The sound
+card is simulated as well, so this runs on any machine with the python
+dependencies installed:
+
+    python3 -m allo_boss2.benchmark --output bench.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from allo_boss2.boss2_oled import OLED, SCREEN, SW_PIN
+from allo_boss2.Hardware.SH1106.SH1106Bus import RecordingBus, modelBusTime
+
+# Every screen, in the order of the SCREEN enum
+SCREENS = list(SCREEN)
+
+BUTTONS = list(SW_PIN)
+
+
+class SimulatedElement:
+    def __init__(self, switch=True, volume=200):
+        self.switch = switch
+        self.volume = volume
+
+    def get_switch(self, channel=0, capture=False):
+        return self.switch
+
+    def set_switch_all(self, value):
+        self.switch = value
+
+    def get_volume(self, channel=0, capture=False):
+        return self.volume
+
+    def set_volume_all(self, value):
+        self.volume = value
+
+    def ask_volume_dB(self, volume):
+        # 0.5 dB per step, 255 being 0 dB
+        return (volume - 255) * 50
+
+
+class SimulatedMixer:
+    def handle_events(self):
+        pass
+
+
+class SimulatedSoundCtrl:
+    """Stands in for SOUND_CTRL, the Boss2 mixer controls kept in memory."""
+
+    def __init__(self):
+        self.card_num = -1
+        self.mixer = SimulatedMixer()
+        self.de_ctrl = SimulatedElement(False)
+        self.hp_ctrl = SimulatedElement(True)
+        self.ph_ctrl = SimulatedElement(True)
+        self.non_ctrl = SimulatedElement(False)
+        self.hv_ctrl = SimulatedElement(False)
+        self.ma_ctrl = SimulatedElement(True, 200)
+        self.dig_ctrl = SimulatedElement(True, 200)
+        self.filter_fast = True
+
+    def change_mute_status(self, mix):
+        mix.set_switch_all(not mix.get_switch(0, False))
+
+    def get_mute_status(self, mix):
+        return mix.get_switch(0, False)
+
+    def getFilterStatus(self):
+        return self.filter_fast
+
+    def setFilterStatus(self, fast):
+        self.filter_fast = fast
+
+    def changeFilterStatus(self):
+        self.setFilterStatus(not self.filter_fast)
+
+
+def measure(bus, view, action, repeat, setup=None):
+    """
+    Runs setup() and action() repeat times, returning the bus counters and
+    the menu rows redrawn of the last run and the median wall time of
+    action().
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        bus.resetCounters()
+        redraws = view.redraws
+        start = time.perf_counter()
+        action()
+        times.append(time.perf_counter() - start)
+    return {
+        "rows_redrawn": view.redraws - redraws,
+        "transactions": bus.transactions,
+        "bytes": bus.bytesWritten,
+        "commands": bus.commands,
+        "data_bytes": bus.dataBytes,
+        "wall_time": statistics.median(times),
+    }
+
+
+def run(clocks, latency, repeat, block_size):
+    bus = RecordingBus(block_size)
+    lcd = OLED(-1, SimulatedSoundCtrl(), bus=bus)
+
+    def bus_times(result):
+        result["bus_time"] = {
+            str(clock): modelBusTime(
+                result["transactions"], result["bytes"], clock, latency
+            )
+            for clock in clocks
+        }
+        return result
+
+    screens = {}
+    for screen in SCREENS:
+        # Coming from another screen, so the screen change is included.
+        previous = SCREEN.MENU if screen == SCREEN.MAIN else SCREEN.MAIN
+        screens[screen.name] = bus_times(
+            measure(
+                bus,
+                lcd.menu_view,
+                lambda: lcd.show(screen),
+                repeat,
+                setup=lambda: lcd.show(previous),
+            )
+        )
+
+    transitions = {}
+    for screen in SCREENS:
+        for pin in BUTTONS:
+
+            def setup(screen=screen):
+                # Every run starts from the same card and switch state, a
+                # toggle applied by the previous run would make it a no-op
+                lcd.attach_sound(SimulatedSoundCtrl())
+                lcd.m_indx = 1
+                lcd.f_indx = 1
+                lcd.ok_flag = False
+                lcd.show(screen)
+
+            transitions[f"{screen.name}:{pin.name}"] = bus_times(
+                measure(
+                    bus,
+                    lcd.menu_view,
+                    lambda: lcd.key_pressed(pin),
+                    repeat,
+                    setup=setup,
+                )
+            )
+
+    return {
+        "clocks": clocks,
+        "transaction_latency": latency,
+        "block_size": block_size,
+        "repeat": repeat,
+        "text_cache": {
+            "hits": lcd.oled.textCacheHits,
+            "misses": lcd.oled.textCacheMisses,
+        },
+        "screens": screens,
+        "transitions": transitions,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OLED screen rendering")
+    parser.add_argument(
+        "--clock",
+        type=int,
+        action="append",
+        help="I2C clock in Hz to model, may be repeated (default 100000 and 400000)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0001,
+        help="fixed cost per I2C transaction in seconds (default 0.0001)",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=RecordingBus.MAX_BLOCK_SIZE,
+        help="largest block write to emulate, 32 for smbus, 8191 for i2c-dev",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="runs per case")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    clocks = args.clock or [100000, 400000]
+    report = run(clocks, args.latency, args.repeat, args.block_size)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
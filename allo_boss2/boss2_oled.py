@@ -19,26 +19,45 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import time
+
+# When the import of this module started, reported by --profile-startup
+# when this module is run directly instead of through allo_boss2.entry
+IMPORT_STARTED = time.perf_counter()
 
-import sched
+import argparse
+import importlib
+import queue
 import signal
 import socket
-import subprocess
 import sys
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
+from typing import TYPE_CHECKING
 
-import netifaces
-from evdev import InputDevice, ecodes, list_devices
-from gpiozero import Button, Device
-from gpiozero.pins.rpigpio import RPiGPIOFactory
+# PIL, gpiozero, evdev, pyalsa and python-mpd2 are imported
+# where they are first needed, so the boot screen is up before they load.
 from allo_boss2.Hardware.SH1106.SH1106LCD import SH1106LCD
-from allo_boss2.persistent_mpd import PersistentMPDClient
-from pyalsa import alsacard, alsamixer
-
-# Force to use RPi pin factory
-Device.pin_factory = RPiGPIOFactory()
+from allo_boss2.Hardware.SH1106.SH1106Marquee import Marquee
+from allo_boss2.menu import ListMenu, MenuItem, MenuView, Toggle
+from allo_boss2.input_watcher import InputDeviceWatcher
+from allo_boss2.mixer_watcher import MixerWatcher
+from allo_boss2.net_watcher import NetworkState, NetworkWatcher, display_addresses
+from allo_boss2.now_playing import (
+    ElapsedTicker,
+    NowPlaying,
+    format_time,
+    read_now_playing,
+)
+from allo_boss2.hw_params import HwParams, HwParamsReader
+from allo_boss2.stream_watcher import StreamWatcher
+from allo_boss2.renderer import AnimationTicker, Renderer
+from allo_boss2.startup_profile import StartupProfile
+
+if TYPE_CHECKING:
+    from pyalsa import alsamixer
 
 
 # Use BCM pin numbering scheme
@@ -50,14 +69,18 @@ class SW_PIN(Enum):
     RIGHT = 24
 
 
-try:
-    ETH_IP = netifaces.ifaddresses("eth0")[2][0]["addr"]
-except Exception:
-    ETH_IP = ""
-try:
-    WLAN_IP = netifaces.ifaddresses("wlan0")[2][0]["addr"]
-except Exception:
-    WLAN_IP = ""
+# gpiozero pin factories, by --pin-factory name
+PIN_FACTORIES = {
+    "rpigpio": ("gpiozero.pins.rpigpio", "RPiGPIOFactory"),
+    "lgpio": ("gpiozero.pins.lgpio", "LGPIOFactory"),
+    "pigpio": ("gpiozero.pins.pigpio", "PiGPIOFactory"),
+    "native": ("gpiozero.pins.native", "NativeFactory"),
+}
+
+# Seconds of inactivity after which the OLED is turned off
+SCREEN_OFF_AFTER = 50
+# Scroll steps per second of lines too long for the screen
+MARQUEE_FPS = 25
 
 
 class SCREEN(Enum):
@@ -68,9 +91,44 @@ class SCREEN(Enum):
     HV = 4
     SP = 5
     HP = 6
-    DE = 6
+    DE = 7
     NON = 8
     PH = 9
+    PLAYING = 10
+
+
+# Menu screens, drawn by OLED.show() and driven by OLED.key_handlers
+MENU_SCREENS = {
+    SCREEN.MENU: ListMenu(
+        items=(
+            MenuItem("SYSINFO", SCREEN.BOOT),
+            MenuItem("HV-EN ", SCREEN.HV, "hv_en", "ON", "OFF"),
+            MenuItem("FILTER", SCREEN.FILTER),
+            MenuItem("F-SPEED-", SCREEN.SP, "fil_sp", "FAS", "SLO"),
+        ),
+        index_attr="m_indx",
+        parent=SCREEN.MAIN,
+    ),
+    SCREEN.FILTER: ListMenu(
+        items=(
+            MenuItem("PHCOMP ", SCREEN.PH, "ph_comp", "EN", "DIS"),
+            MenuItem("HP-FIL ", SCREEN.HP, "hp_fil", "EN", "DIS"),
+            MenuItem("DE-EMP ", SCREEN.DE, "de_emp", "EN", "DIS"),
+            MenuItem("NON-OS ", SCREEN.NON, "non_os", "EN", "DIS"),
+        ),
+        index_attr="f_indx",
+        parent=SCREEN.MENU,
+        label_col=5,
+        separator_col=64,
+        value_col=80,
+    ),
+    SCREEN.HV: Toggle("HV ENABLE", 20, "hv_en", "ON", "OFF", 20, 70, SCREEN.MENU),
+    SCREEN.SP: Toggle("FILTER SPEED", 5, "fil_sp", "FAST", "SLOW", 10, 80, SCREEN.MENU),
+    SCREEN.HP: Toggle("HP-FILT", 20, "hp_fil", "EN", "DIS", 10, 70, SCREEN.FILTER),
+    SCREEN.DE: Toggle("DE-EMPH", 20, "de_emp", "EN", "DIS", 10, 70, SCREEN.FILTER),
+    SCREEN.NON: Toggle("NON-OSAMP", 20, "non_os", "EN", "DIS", 10, 70, SCREEN.FILTER),
+    SCREEN.PH: Toggle("PHA-COMP", 20, "ph_comp", "EN", "DIS", 10, 70, SCREEN.FILTER),
+}
 
 
 def db_show_vol(vol_db):
@@ -83,6 +141,8 @@ def db_show_vol(vol_db):
 
 class SOUND_CTRL:
     def __init__(self):
+        from pyalsa import alsahcontrol, alsamixer
+
         self.card_num = self.getCardNumber()
 
         self.mixer = alsamixer.Mixer()
@@ -109,16 +169,30 @@ class SOUND_CTRL:
         self.ma_ctrl = alsamixer.Element(mixer=self.mixer, name="Master", index=0)
         self.dig_ctrl = alsamixer.Element(mixer=self.mixer, name="Digital", index=0)
 
-    def change_mute_status(self, mix: alsamixer.Element):
+        # "PCM Filter Speed" is an enumerated control, which alsamixer can
+        # not read or set. Use the hcontrol API on the same card instead.
+        self.hctl = alsahcontrol.HControl(name="hw:%d" % self.card_num)
+        self.sp_elem = alsahcontrol.Element(
+            self.hctl,
+            (alsahcontrol.interface_id["MIXER"], 0, 0, "PCM Filter Speed", 0),
+        )
+        sp_info = alsahcontrol.Info(self.sp_elem)
+        self.sp_items = list(sp_info.item_names)
+        self.sp_count = sp_info.count
+        self.sp_type = alsahcontrol.element_type["ENUMERATED"]
+
+    def change_mute_status(self, mix: "alsamixer.Element"):
         mute_status = mix.get_switch(0, False)
         mix.set_switch_all(not mute_status)
 
     # Return True for unmute False for mute
-    def get_mute_status(self, mix: alsamixer.Element) -> bool:
+    def get_mute_status(self, mix: "alsamixer.Element") -> bool:
         mute_status = mix.get_switch(0, False)
         return mute_status
 
     def getCardNumber(self):
+        from pyalsa import alsacard
+
         sound_cards = alsacard.card_list()
         for sound_card in sound_cards:
             if "Allo Boss2" == alsacard.card_get_name(card=sound_card):
@@ -128,67 +202,179 @@ class SOUND_CTRL:
 
     # Return True for speed False for slow
     def getFilterStatus(self) -> bool:
-        cmd = f"amixer -c {self.card_num} get 'PCM Filter Speed' | grep Item0"
-        proc = subprocess.Popen(
-            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        out, _ = proc.communicate()
-        word_str = out.decode().split()
-        current_status = word_str[1]
-        return current_status != "'Slow'"
+        from pyalsa import alsahcontrol
+
+        value = alsahcontrol.Value(self.sp_elem)
+        value.read()
+        item = value.get_tuple(self.sp_type, self.sp_count)[0]
+        return self.sp_items[item] != "Slow"
+
+    def setFilterStatus(self, fast: bool):
+        from pyalsa import alsahcontrol
+
+        item = self.sp_items.index("Fast" if fast else "Slow")
+        value = alsahcontrol.Value(self.sp_elem)
+        value.set_tuple(self.sp_type, (item,) * self.sp_count)
+        value.write()
 
     def changeFilterStatus(self):
-        if self.getFilterStatus():
-            cmd = f"amixer -c {self.card_num} set 'PCM Filter Speed' Slow"
-        else:
-            cmd = f"amixer -c {self.card_num} set 'PCM Filter Speed' Fast"
-        proc = subprocess.Popen(
-            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        proc.communicate()
+        self.setFilterStatus(not self.getFilterStatus())
 
 
 class OLED:
     _h_name = f"HOST: {socket.gethostname()}"
 
-    def __init__(self, card_num, snd_ctrl: SOUND_CTRL):
-        self.oled = SH1106LCD()
+    def __init__(
+        self,
+        card_num=None,
+        snd_ctrl: SOUND_CTRL = None,
+        bus=None,
+        network: NetworkState = None,
+    ):
+        self.oled = SH1106LCD(busType="i2c-dev", bus=bus)
         self.t_lock = threading.Lock()
         self.current_screen = SCREEN.MAIN
         self.current_hw_line = ""
+        self.current_vol_line = ""
+        self.current_mute_line = ""
+        # Addresses shown by the SYSINFO screen, from the network snapshot
+        self.network = network
+        self.current_address_lines = ()
+        # row -> text of the now playing screen
+        self.current_playing_lines = {}
+        # row -> Marquee of the now playing screen, and the one scrolling
+        self.marquees = {}
+        self.marquee_row = None
+        # Set from the MPD idle connection, see now_playing_lines()
+        self.now_playing = NowPlaying()
         self.oled.powerUp()
+        self.screen_is_on = True
         self.oled.clearScreen()
+        self.menu_view = MenuView(self.oled)
         self.card_num = card_num
+        self.hw_reader = None
         self.m_indx = 1
         self.f_indx = 1
         self.ok_flag = False
 
-        self.hp_fil = snd_ctrl.get_mute_status(snd_ctrl.hp_ctrl)
-        self.hv_en = snd_ctrl.get_mute_status(snd_ctrl.hv_ctrl)
-        self.non_os = snd_ctrl.get_mute_status(snd_ctrl.non_ctrl)
-        self.ph_comp = snd_ctrl.get_mute_status(snd_ctrl.ph_ctrl)
-        self.de_emp = snd_ctrl.get_mute_status(snd_ctrl.de_ctrl)
-        self.filter_cur = snd_ctrl.getFilterStatus()
-        self.fil_sp = self.filter_cur
+        # Switch states, read from the card by attach_sound()
+        self.hp_fil = False
+        self.hv_en = False
+        self.non_os = False
+        self.ph_comp = False
+        self.de_emp = False
+        self.fil_sp = False
 
         self.led_off_counter = 0
+        self.snd_ctrl = None
+        if snd_ctrl is not None:
+            self.attach_sound(snd_ctrl)
+        # Set by the asyncio runtime, see _flush() and touch()
+        self.flush_callback = None
+        self.activity_callback = None
+        # Called when a line starts scrolling, see marquee_tick()
+        self.scroll_callback = None
+        # Renderer thread drawing requests are handed to, see request()
+        self.renderer = None
+        self.key_handlers = self._build_key_handlers()
+
+    # The display comes up before the sound card is probed, the screens
+    # showing the card can only be used once it is attached
+    def attach_sound(self, snd_ctrl: SOUND_CTRL):
         self.snd_ctrl = snd_ctrl
+        if self.card_num is None:
+            self.card_num = snd_ctrl.card_num
+        self.hw_reader = HwParamsReader(self.card_num)
+        for name, value in self.read_switches().items():
+            setattr(self, name, value)
+
+    def _flush(self):
+        if self.flush_callback is not None:
+            self.flush_callback()
+            return
+        with self.t_lock:
+            self.oled.flush()
+
+    # Runs a drawing function on the renderer thread if there is one.
+    # Requests with the same key not yet drawn are replaced by the last one.
+    def request(self, key, func, *args):
+        if self.renderer is None:
+            func(*args)
+        else:
+            self.renderer.submit(key, func, *args)
+
+    # Restarts the screen off timeout
+    def touch(self):
+        self.led_off_counter = 0
+        if self.activity_callback is not None:
+            self.activity_callback()
+
+    def screen_off(self):
+        self.screen_is_on = False
+        self.oled.powerDown()
+
+    def screen_on(self):
+        self.screen_is_on = True
+        self.oled.powerUp()
+        # scrolling stops while the screen is off
+        if self.scroll_callback is not None:
+            self.scroll_callback()
+
+    # Called every second by the threads runtime
+    def screen_off_tick(self):
+        if self.led_off_counter >= SCREEN_OFF_AFTER:
+            self.screen_off()
+        elif self.led_off_counter == 1:
+            self.screen_on()
+        self.led_off_counter += 1
 
     def _check_screen(self, scr: SCREEN):
         if self.current_screen != scr:
             self.oled.clearScreen()
+            self.menu_view.reset()
             self.current_hw_line = ""
+            self.current_vol_line = ""
+            self.current_mute_line = ""
+            self.current_address_lines = ()
+            self.current_playing_lines = {}
+            self.marquees = {}
         self.current_screen = scr
 
     def boot_screen(self):
         self._check_screen(SCREEN.BOOT)
         with self.t_lock:
             self.oled.clearScreen()
+            self.menu_view.reset()
             self.oled.displayString("BOSS2", 0, 0)
-            self.oled.displayStringNumber(ETH_IP, 2, 0)
-            # SHowing 13 Chars of hostname
-            self.oled.displayString(str(self._h_name[:13]), 4, 0)
-            self.oled.displayStringNumber(WLAN_IP, 6, 0)
+            # hostnames too wide for the screen scroll like the addresses
+            host = Marquee(self.oled, self._h_name, 4, fontName="cap")
+            host.draw()
+            self.marquees[4] = host
+            self.current_address_lines = ()
+        # starts the scrolling of the hostname as well
+        self.address_lines()
+
+    # The two best addresses, on the rows eth0 and wlan0 used to be shown.
+    # Only reads the snapshot kept by the network watcher. Addresses too
+    # wide for the screen, i.e. most IPv6 ones, scroll.
+    def address_lines(self):
+        if self.current_screen != SCREEN.BOOT:
+            return
+        addresses = []
+        if self.network is not None:
+            addresses = display_addresses(self.network.interfaces)
+        lines = tuple((addresses + ["", ""])[:2])
+        if lines == self.current_address_lines:
+            return
+        with self.t_lock:
+            for row, line in zip((2, 6), lines):
+                marquee = Marquee(self.oled, line, row, fontName="number")
+                marquee.draw()
+                self.marquees[row] = marquee
+        self.current_address_lines = lines
+        self._flush()
+        if self.scrolling() and self.scroll_callback is not None:
+            self.scroll_callback()
 
     def volume_line(self, volume=None):
         if self.current_screen == SCREEN.MAIN:
@@ -196,41 +382,171 @@ class OLED:
                 self.snd_ctrl.mixer.handle_events()
                 volume = self.snd_ctrl.ma_ctrl.get_volume()
             vol_list = db_show_vol(self.snd_ctrl.ma_ctrl.ask_volume_dB(volume))
-            with self.t_lock:
-                self.oled.displayString(f"  {vol_list}".ljust(8, " ") + "dB", 1, 1)
+            vol_line = f"  {vol_list}".ljust(8, " ") + "dB"
+            if self.current_vol_line != vol_line:
+                self.touch()
+                self.current_vol_line = vol_line
+                with self.t_lock:
+                    self.oled.displayString(vol_line, 1, 1)
+                self._flush()
 
     def mute_line(self):
         if self.current_screen == SCREEN.MAIN:
-            with self.t_lock:
-                if self.snd_ctrl.get_mute_status(self.snd_ctrl.ma_ctrl):
-                    self.oled.displayString("  ", 3, 50)
-                else:
-                    self.oled.displayString("@", 3, 50)
-
-    def hw_line(self):
-        bit_rate = "closed"
-        bit_format = 0
-        if self.current_screen == SCREEN.MAIN:
-            with open(
-                f"/proc/asound/card{self.card_num}/pcm0p/sub0/hw_params"
-            ) as hw_params:
-                for line in hw_params:
-                    if line.startswith("format:"):
-                        format_val = line.split(":")
-                        bit_rate = format_val[1].strip()[1:3]
-                    if line.startswith("rate:"):
-                        rate_val = line.split(":")
-                        bit_format = int(rate_val[1].strip().split()[0])
-            if bit_rate == "closed":
-                hw_line = "No stream"
+            if self.snd_ctrl.get_mute_status(self.snd_ctrl.ma_ctrl):
+                mute_line = "  "
             else:
-                hw_line = f"S{bit_rate} {bit_format}"
+                mute_line = "@"
+            if self.current_mute_line != mute_line:
+                self.touch()
+                self.current_mute_line = mute_line
+                with self.t_lock:
+                    self.oled.displayString(mute_line, 3, 50)
+                self._flush()
+
+    def hw_line(self, stream: HwParams = None):
+        if self.current_screen == SCREEN.MAIN:
+            if stream is None:
+                stream = self.hw_reader.read()
+            hw_line = stream.label
             if self.current_hw_line != hw_line:
-                self.led_off_counter = 0
+                self.touch()
                 self.current_hw_line = hw_line
                 with self.t_lock:
                     self.oled.displayString("                  ", 5, 5)
                     self.oled.displayString(hw_line, 5, 5)
+                self._flush()
+
+    def _playing_line(self, row, text, font="line1"):
+        if self.current_playing_lines.get(row) == text:
+            return False
+        self.current_playing_lines[row] = text
+        with self.t_lock:
+            self.oled.clearRow(row)
+            if font == "number":
+                self.oled.clearRow(row + 1)
+                self.oled.displayStringNumber(text, row, 0)
+            else:
+                self.oled.displayStringLine1(text, row, 0)
+        return True
+
+    # Screens with lines scrolled by marquee_tick()
+    SCROLLING_SCREENS = (SCREEN.PLAYING, SCREEN.BOOT)
+
+    # Line of the now playing screen scrolling text too long to fit
+    def _marquee_line(self, row, text):
+        if self.current_playing_lines.get(row) == text:
+            return
+        self.current_playing_lines[row] = text
+        marquee = Marquee(self.oled, text, row)
+        with self.t_lock:
+            self.oled.clearRow(row)
+            marquee.draw()
+        self.marquees[row] = marquee
+        if marquee.scrolling:
+            # only one line scrolls at a time, this one once the others are done
+            if self.scroll_callback is not None:
+                self.scroll_callback()
+
+    def scrolling(self) -> bool:
+        if not self.screen_is_on or self.current_screen not in self.SCROLLING_SCREENS:
+            return False
+        # called by the animation thread while the renderer may add lines
+        marquees = list(self.marquees.values())
+        return any(marquee.scrolling for marquee in marquees)
+
+    # Advances the scrolling line of the now playing or SYSINFO screen by one step.
+    # Lines take turns, so a tick changes a single page of the panel.
+    def marquee_tick(self):
+        if not self.scrolling():
+            return
+        scrolling = [row for row, m in sorted(self.marquees.items()) if m.scrolling]
+        if self.marquee_row not in scrolling:
+            self.marquee_row = scrolling[0]
+        with self.t_lock:
+            wrapped = self.marquees[self.marquee_row].tick()
+        if wrapped:
+            index = scrolling.index(self.marquee_row)
+            self.marquee_row = scrolling[(index + 1) % len(scrolling)]
+        self._flush()
+
+    def elapsed_line(self):
+        if self.current_screen == SCREEN.PLAYING:
+            now_playing = self.now_playing
+            elapsed = format_time(now_playing.position())
+            if now_playing.duration:
+                elapsed += " / " + format_time(now_playing.duration)
+            if now_playing.state == "stop":
+                elapsed = ""
+            if self._playing_line(6, elapsed, "number"):
+                self._flush()
+
+    # Redraws the lines of the now playing screen that changed
+    def now_playing_lines(self):
+        if self.current_screen == SCREEN.PLAYING:
+            now_playing = self.now_playing
+            self._marquee_line(0, now_playing.title)
+            self._marquee_line(2, now_playing.artist)
+            self._playing_line(4, now_playing.flags)
+            self.elapsed_line()
+            self._flush()
+
+    def playing_screen(self):
+        self._check_screen(SCREEN.PLAYING)
+        self.now_playing_lines()
+
+    # Switch state attribute -> screen on which the user edits it
+    SWITCH_SCREENS = {
+        "hv_en": SCREEN.HV,
+        "fil_sp": SCREEN.SP,
+        "hp_fil": SCREEN.HP,
+        "de_emp": SCREEN.DE,
+        "non_os": SCREEN.NON,
+        "ph_comp": SCREEN.PH,
+    }
+
+    # Switch state attribute -> SOUND_CTRL element, fil_sp is an enumerated
+    # control handled by getFilterStatus/setFilterStatus
+    SWITCH_CONTROLS = {
+        "hv_en": "hv_ctrl",
+        "hp_fil": "hp_ctrl",
+        "de_emp": "de_ctrl",
+        "non_os": "non_ctrl",
+        "ph_comp": "ph_ctrl",
+    }
+
+    def read_switches(self) -> dict:
+        switches = {"fil_sp": self.snd_ctrl.getFilterStatus()}
+        for name, ctrl in self.SWITCH_CONTROLS.items():
+            switches[name] = self.snd_ctrl.get_mute_status(getattr(self.snd_ctrl, ctrl))
+        return switches
+
+    # Writes the switch state attribute to ALSA if it differs
+    def write_switch(self, name):
+        value = getattr(self, name)
+        if name == "fil_sp":
+            if self.snd_ctrl.getFilterStatus() != value:
+                self.snd_ctrl.setFilterStatus(value)
+            return
+        ctrl = getattr(self.snd_ctrl, self.SWITCH_CONTROLS[name])
+        if self.snd_ctrl.get_mute_status(ctrl) != value:
+            self.snd_ctrl.change_mute_status(ctrl)
+
+    # Called by MixerWatcher after mixer events were handled
+    def mixer_changed(self):
+        changed = set()
+        for name, value in self.read_switches().items():
+            # Don't override a selection the user has not confirmed yet
+            if self.current_screen == self.SWITCH_SCREENS[name]:
+                continue
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed.add(name)
+        if self.current_screen == SCREEN.MAIN:
+            self.volume_line()
+            self.mute_line()
+        elif changed and isinstance(MENU_SCREENS.get(self.current_screen), ListMenu):
+            # only the cells showing a changed switch are redrawn
+            self.show(self.current_screen)
 
     def volume_screen(self):
         self._check_screen(SCREEN.MAIN)
@@ -238,493 +554,356 @@ class OLED:
         self.mute_line()
         self.hw_line()
 
-    def menu_screen(self):
-        self._check_screen(SCREEN.MENU)
-        if self.m_indx == 1:
-            self.oled.displayInvertedString("SYSINFO", 0, 0)
-        else:
-            self.oled.displayString("SYSINFO", 0, 0)
-        if self.m_indx == 2:
-            if self.hv_en:
-                self.oled.displayInvertedString("HV-EN ON", 2, 0)
-            else:
-                self.oled.displayInvertedString("HV-EN OFF", 2, 0)
-        else:
-            if self.hv_en:
-                self.oled.displayString("HV-EN ON", 2, 0)
-            else:
-                self.oled.displayString("HV-EN OFF", 2, 0)
-        if self.m_indx == 3:
-            self.oled.displayInvertedString("FILTER", 4, 0)
-        else:
-            self.oled.displayString("FILTER", 4, 0)
-        if self.m_indx == 4:
-            if self.fil_sp:
-                self.oled.displayInvertedString("F-SPEED-FAS", 6, 0)
-            else:
-                self.oled.displayInvertedString("F-SPEED-SLO", 6, 0)
+    def show(self, scr: SCREEN):
+        if scr == SCREEN.MAIN:
+            self.volume_screen()
+        elif scr == SCREEN.BOOT:
+            self.boot_screen()
+        elif scr == SCREEN.PLAYING:
+            self.playing_screen()
         else:
-            if self.fil_sp:
-                self.oled.displayString("F-SPEED-FAS", 6, 0)
+            self._check_screen(scr)
+            self.menu_view.draw(MENU_SCREENS[scr].cells(self))
+            self._flush()
+
+    # (screen, button) -> handler
+    def _build_key_handlers(self) -> dict:
+        handlers = {
+            (SCREEN.MAIN, SW_PIN.LEFT): self.volume_screen,
+            (SCREEN.MAIN, SW_PIN.RIGHT): partial(self.show, SCREEN.MENU),
+            (SCREEN.MAIN, SW_PIN.DOWN): self.playing_screen,
+            (SCREEN.PLAYING, SW_PIN.LEFT): self.volume_screen,
+            (SCREEN.PLAYING, SW_PIN.UP): self.volume_screen,
+            (SCREEN.PLAYING, SW_PIN.RIGHT): partial(self.show, SCREEN.MENU),
+            (SCREEN.BOOT, SW_PIN.LEFT): self.volume_screen,
+            (SCREEN.BOOT, SW_PIN.OK): partial(self.show, SCREEN.MENU),
+            (SCREEN.BOOT, SW_PIN.RIGHT): partial(self.show, SCREEN.MENU),
+            (SCREEN.MENU, SW_PIN.RIGHT): self.volume_screen,
+        }
+        for scr, menu in MENU_SCREENS.items():
+            if isinstance(menu, ListMenu):
+                handlers[(scr, SW_PIN.LEFT)] = partial(self.show, menu.parent)
+                handlers[(scr, SW_PIN.OK)] = partial(self._menu_open, menu)
+                handlers[(scr, SW_PIN.UP)] = partial(self._menu_move, scr, menu, -1)
+                handlers[(scr, SW_PIN.DOWN)] = partial(self._menu_move, scr, menu, 1)
             else:
-                self.oled.displayString("F-SPEED-SLO", 6, 0)
-
-    def filter_screen(self):
-        self._check_screen(SCREEN.FILTER)
-        if self.f_indx == 1:
-            self.oled.displayInvertedString("PHCOMP ", 0, 5)
-            self.oled.displayInvertedString("| ", 0, 64)
-            if self.ph_comp:
-                self.oled.displayInvertedString("EN", 0, 80)
+                handlers[(scr, SW_PIN.LEFT)] = partial(
+                    self._toggle_select, scr, menu, True
+                )
+                handlers[(scr, SW_PIN.RIGHT)] = partial(
+                    self._toggle_select, scr, menu, False
+                )
+                handlers[(scr, SW_PIN.DOWN)] = partial(self._toggle_unconfirm, scr)
+                handlers[(scr, SW_PIN.OK)] = partial(self._toggle_apply, menu)
+        return handlers
+
+    def _menu_move(self, scr: SCREEN, menu: ListMenu, step: int):
+        index = getattr(self, menu.index_attr) + step
+        # UP stops at the first item, DOWN wraps around
+        if index < 1:
+            index = 1
+        elif index > len(menu.items):
+            index = 1
+        setattr(self, menu.index_attr, index)
+        self.show(scr)
+
+    def _menu_open(self, menu: ListMenu):
+        self.show(menu.items[getattr(self, menu.index_attr) - 1].target)
+
+    def _toggle_select(self, scr: SCREEN, toggle: Toggle, value: bool):
+        setattr(self, toggle.attr, value)
+        self.show(scr)
+
+    def _toggle_unconfirm(self, scr: SCREEN):
+        self.ok_flag = False
+        self.show(scr)
+
+    def _toggle_apply(self, toggle: Toggle):
+        self.ok_flag = True
+        self.write_switch(toggle.attr)
+        self.show(toggle.parent)
+
+    def key_pressed(self, pin_nr: SW_PIN):
+        handler = self.key_handlers.get((self.current_screen, pin_nr))
+        if handler is not None:
+            handler()
+
+    def button_callback(self, btn):
+        self.touch()
+        self.key_pressed(SW_PIN(btn.pin.number))
+
+
+class REMOTE_CTRL:
+    PRESS_HOLD_EVENTS = [1, 2]
+
+    def __init__(self, sound_ctrl: SOUND_CTRL, lcd: OLED, mpd_client, mpd_submit=None):
+        self.sound_ctrl = sound_ctrl
+        self.lcd = lcd
+        self.mpd_client = mpd_client
+        # Sends an MPD command by name without waiting for it. When not set
+        # commands are sent on mpd_client by the calling thread.
+        self.mpd_submit = mpd_submit
+        self.curr_vol = sound_ctrl.ma_ctrl.get_volume()
+
+    def _mpd_call(self, cmd):
+        try:
+            getattr(self.mpd_client, cmd)()
+        except Exception:
+            pass
+
+    def mpd_command(self, cmd):
+        if self.mpd_submit is not None:
+            self.mpd_submit(cmd)
+        elif self.mpd_client is not None:
+            self._mpd_call(cmd)
+
+    def set_volume(self, new_vol):
+        self.curr_vol = new_vol
+        self.sound_ctrl.dig_ctrl.set_volume_all(new_vol)
+        self.sound_ctrl.ma_ctrl.set_volume_all(new_vol)
+        # ALSA is set right away, only the redraw may be coalesced
+        self.lcd.request("volume", self.lcd.volume_line, new_vol)
+
+    def handle_event(self, event):
+        from evdev import ecodes
+
+        if event.type != ecodes.EV_KEY or event.value not in self.PRESS_HOLD_EVENTS:
+            return
+        sound_ctrl = self.sound_ctrl
+        # the volume may have been changed by another mixer client
+        curr_vol = self.curr_vol = sound_ctrl.ma_ctrl.get_volume()
+        if event.code == ecodes.KEY_RIGHT:
+            self.mpd_command("next")
+        elif event.code == ecodes.KEY_LEFT:
+            self.mpd_command("previous")
+        elif event.code == ecodes.KEY_MUTE:
+            sound_ctrl.change_mute_status(sound_ctrl.ma_ctrl)
+            sound_ctrl.change_mute_status(sound_ctrl.dig_ctrl)
+            self.lcd.request("mute", self.lcd.mute_line)
+        elif event.code == ecodes.KEY_PLAY:
+            self.mpd_command("pause")
+        elif event.code == ecodes.KEY_OK:
+            pass
+        elif event.code == ecodes.KEY_VOLUMEUP:
+            if curr_vol < 140:
+                new_vol = curr_vol + 4
+            elif curr_vol < 220:
+                new_vol = curr_vol + 2
             else:
-                self.oled.displayInvertedString("DIS", 0, 80)
-        else:
-            self.oled.displayString("PHCOMP ", 0, 5)
-            self.oled.displayString("| ", 0, 64)
-            if self.ph_comp:
-                self.oled.displayString("EN", 0, 80)
+                new_vol = curr_vol + 1
+            self.set_volume(min(new_vol, 255))
+        elif event.code == ecodes.KEY_VOLUMEDOWN:
+            if curr_vol < 140:
+                new_vol = curr_vol - 4
+            elif curr_vol < 220:
+                new_vol = curr_vol - 2
             else:
-                self.oled.displayString("DIS", 0, 80)
+                new_vol = curr_vol - 1
+            self.set_volume(max(new_vol, 0))
+        self.lcd.touch()
 
-        if self.f_indx == 2:
-            self.oled.displayInvertedString("HP-FIL ", 2, 5)
-            self.oled.displayInvertedString("| ", 2, 64)
-            if self.hp_fil:
-                self.oled.displayInvertedString("EN", 2, 80)
-            else:
-                self.oled.displayInvertedString("DIS", 2, 80)
-        else:
-            self.oled.displayString("HP-FIL ", 2, 5)
-            self.oled.displayString("| ", 2, 64)
-            if self.hp_fil:
-                self.oled.displayString("EN", 2, 80)
-            else:
-                self.oled.displayString("DIS", 2, 80)
-        if self.f_indx == 3:
-            self.oled.displayInvertedString("DE-EMP ", 4, 5)
-            self.oled.displayInvertedString("| ", 4, 64)
-            if self.de_emp:
-                self.oled.displayInvertedString("EN", 4, 80)
-            else:
-                self.oled.displayInvertedString("DIS", 4, 80)
-        else:
-            self.oled.displayString("DE-EMP ", 4, 5)
-            self.oled.displayString("| ", 4, 64)
-            if self.de_emp:
-                self.oled.displayString("EN", 4, 80)
-            else:
-                self.oled.displayString("DIS", 4, 80)
-        if self.f_indx == 4:
-            self.oled.displayInvertedString("NON-OS ", 6, 5)
-            self.oled.displayInvertedString("| ", 6, 64)
-            if self.non_os:
-                self.oled.displayInvertedString("EN", 6, 80)
-            else:
-                self.oled.displayInvertedString("DIS", 6, 80)
-        else:
-            self.oled.displayString("NON-OS ", 6, 5)
-            self.oled.displayString("| ", 6, 64)
-            if self.non_os:
-                self.oled.displayString("EN", 6, 80)
-            else:
-                self.oled.displayString("DIS", 6, 80)
-
-    def sp_screen(self):
-        self._check_screen(SCREEN.SP)
-        self.oled.displayString("FILTER SPEED", 0, 5)
-        if self.fil_sp:
-            self.oled.displayInvertedString("FAST", 3, 10)
-            self.oled.displayString("SLOW", 3, 80)
-        else:
-            self.oled.displayString("FAST", 3, 10)
-            self.oled.displayInvertedString("SLOW", 3, 80)
-        if self.ok_flag:
-            self.oled.displayInvertedString("OK", 6, 50)
-        else:
-            self.oled.displayString("OK", 6, 50)
-
-    def hp_screen(self):
-        self._check_screen(SCREEN.HP)
-        self.oled.displayString("HP-FILT", 0, 20)
-        if self.hp_fil:
-            self.oled.displayInvertedString("EN", 3, 10)
-            self.oled.displayString("DIS", 3, 70)
-        else:
-            self.oled.displayString("EN", 3, 10)
-            self.oled.displayInvertedString("DIS", 3, 70)
-        if self.ok_flag:
-            self.oled.displayInvertedString("OK", 6, 50)
-        else:
-            self.oled.displayString("OK", 6, 50)
-
-    def de_screen(self):
-        self._check_screen(SCREEN.DE)
-        self.oled.displayString("DE-EMPH", 0, 20)
-        if self.de_emp:
-            self.oled.displayInvertedString("EN", 3, 10)
-            self.oled.displayString("DIS", 3, 70)
-        else:
-            self.oled.displayString("EN", 3, 10)
-            self.oled.displayInvertedString("DIS", 3, 70)
-        if self.ok_flag:
-            self.oled.displayInvertedString("OK", 6, 50)
-        else:
-            self.oled.displayString("OK", 6, 50)
-
-    def non_screen(self):
-        self._check_screen(SCREEN.NON)
-        self.oled.displayString("NON-OSAMP", 0, 20)
-        if self.non_os:
-            self.oled.displayInvertedString("EN", 3, 10)
-            self.oled.displayString("DIS", 3, 70)
-        else:
-            self.oled.displayString("EN", 3, 10)
-            self.oled.displayInvertedString("DIS", 3, 70)
-        if self.ok_flag:
-            self.oled.displayInvertedString("OK", 6, 50)
-        else:
-            self.oled.displayString("OK", 6, 50)
-
-    def ph_screen(self):
-        self._check_screen(SCREEN.PH)
-        self.oled.displayString("PHA-COMP", 0, 20)
-        if self.ph_comp:
-            self.oled.displayInvertedString("EN", 3, 10)
-            self.oled.displayString("DIS", 3, 70)
-        else:
-            self.oled.displayString("EN", 3, 10)
-            self.oled.displayInvertedString("DIS", 3, 70)
-        if self.ok_flag:
-            self.oled.displayInvertedString("OK", 6, 50)
-        else:
-            self.oled.displayString("OK", 6, 50)
-
-    def hv_screen(self):
-        self._check_screen(SCREEN.HV)
-        self.oled.displayString("HV ENABLE", 0, 20)
-        if self.hv_en:
-            self.oled.displayInvertedString("ON", 3, 20)
-            self.oled.displayString("OFF", 3, 70)
-        else:
-            self.oled.displayString("ON", 3, 20)
-            self.oled.displayInvertedString("OFF", 3, 70)
-        if self.ok_flag:
-            self.oled.displayInvertedString("OK", 6, 50)
-        else:
-            self.oled.displayString("OK", 6, 50)
-
-    def sw_left_callback(self):
-        if (
-            self.current_screen == SCREEN.MAIN
-            or self.current_screen == SCREEN.BOOT
-            or self.current_screen == SCREEN.MENU
-        ):
-            self.volume_screen()
-        elif self.current_screen == SCREEN.FILTER:
-            self.menu_screen()
-        elif self.current_screen == SCREEN.HV:
-            if not self.hv_en:
-                self.hv_en = True
-                self.hv_screen()
-        elif self.current_screen == SCREEN.SP:
-            if not self.fil_sp:
-                self.fil_sp = True
-                self.sp_screen()
-        elif self.current_screen == SCREEN.HP:
-            if not self.hp_fil:
-                self.hp_fil = True
-                self.hp_screen()
-        elif self.current_screen == SCREEN.DE:
-            if not self.de_emp:
-                self.de_emp = True
-                self.de_screen()
-        elif self.current_screen == SCREEN.NON:
-            if not self.non_os:
-                self.non_os = True
-                self.non_screen()
-        elif self.current_screen == SCREEN.PH:
-            if not self.ph_comp:
-                self.ph_comp = True
-                self.ph_screen()
-        else:
-            print(self.current_screen)
-
-    def sw_ok_callback(self):
-        if self.current_screen == SCREEN.MENU:
-            if self.m_indx == 1:
-                self.boot_screen()
-            elif self.m_indx == 2:
-                self.hv_screen()
-            elif self.m_indx == 3:
-                self.filter_screen()
-            elif self.m_indx == 4:
-                self.sp_screen()
-        elif self.current_screen == SCREEN.BOOT:
-            self.menu_screen()
-        elif self.current_screen == SCREEN.FILTER:
-            if self.f_indx == 1:
-                self.ph_screen()
-            elif self.f_indx == 2:
-                self.hp_screen()
-            elif self.f_indx == 3:
-                self.de_screen()
-            elif self.f_indx == 4:
-                self.non_screen()
-        elif self.current_screen == SCREEN.HV:
-            self.ok_flag = True
-            if self.snd_ctrl.get_mute_status(self.snd_ctrl.hv_ctrl) != self.hv_en:
-                self.snd_ctrl.change_mute_status(self.snd_ctrl.hv_ctrl)
-            self.menu_screen()
-        elif self.current_screen == SCREEN.SP:
-            self.ok_flag = True
-            filter_cur = self.snd_ctrl.getFilterStatus()
-            if filter_cur != self.fil_sp:
-                self.snd_ctrl.changeFilterStatus()
-            self.menu_screen()
-        elif self.current_screen == SCREEN.HP:
-            self.ok_flag = True
-            if self.snd_ctrl.get_mute_status(self.snd_ctrl.hp_ctrl) != self.hp_fil:
-                self.snd_ctrl.change_mute_status(self.snd_ctrl.hp_ctrl)
-            self.filter_screen()
-        elif self.current_screen == SCREEN.DE:
-            self.ok_flag = True
-            if self.snd_ctrl.get_mute_status(self.snd_ctrl.de_ctrl) != self.de_emp:
-                self.snd_ctrl.change_mute_status(self.snd_ctrl.de_ctrl)
-            self.filter_screen()
-        elif self.current_screen == SCREEN.NON:
-            self.ok_flag = True
-            if self.snd_ctrl.get_mute_status(self.snd_ctrl.non_ctrl) != self.non_os:
-                self.snd_ctrl.change_mute_status(self.snd_ctrl.non_ctrl)
-            self.filter_screen()
-        elif self.current_screen == SCREEN.PH:
-            self.ok_flag = True
-            if self.snd_ctrl.get_mute_status(self.snd_ctrl.ph_ctrl) != self.ph_comp:
-                self.snd_ctrl.change_mute_status(self.snd_ctrl.ph_ctrl)
-            self.filter_screen()
-
-    def sw_up_callback(self):
-        if self.current_screen == SCREEN.MENU:
-            if self.m_indx > 1:
-                self.m_indx -= 1
-            self.menu_screen()
-        elif self.current_screen == SCREEN.FILTER:
-            if self.f_indx > 1:
-                self.f_indx -= 1
-            self.filter_screen()
-
-    def sw_down_callback(self):
-        if self.current_screen == SCREEN.MENU:
-            self.m_indx += 1
-            if self.m_indx > 4:
-                self.m_indx = 1
-            self.menu_screen()
-        elif self.current_screen == SCREEN.FILTER:
-            self.f_indx += 1
-            if self.f_indx > 4:
-                self.f_indx = 1
-            self.filter_screen()
-        elif self.current_screen == SCREEN.HV:
-            if self.ok_flag:
-                self.ok_flag = False
-            self.hv_screen()
-        elif self.current_screen == SCREEN.SP:
-            if self.ok_flag:
-                self.ok_flag = False
-            self.sp_screen()
-        elif self.current_screen == SCREEN.HP:
-            if self.ok_flag:
-                self.ok_flag = False
-            self.hp_screen()
-        elif self.current_screen == SCREEN.DE:
-            if self.ok_flag:
-                self.ok_flag = False
-            self.de_screen()
-        elif self.current_screen == SCREEN.NON:
-            if self.ok_flag:
-                self.ok_flag = False
-            self.non_screen()
-        elif self.current_screen == SCREEN.PH:
-            if self.ok_flag:
-                self.ok_flag = False
-            self.ph_screen()
-
-    def sw_right_callback(self):
-        if self.current_screen == SCREEN.MAIN or self.current_screen == SCREEN.BOOT:
-            self.menu_screen()
-        elif self.current_screen == SCREEN.MENU:
-            self.volume_screen()
-        elif self.current_screen == SCREEN.HV:
-            if self.hv_en:
-                self.hv_en = False
-            self.hv_screen()
-        elif self.current_screen == SCREEN.SP:
-            if self.fil_sp:
-                self.fil_sp = False
-            self.sp_screen()
-        elif self.current_screen == SCREEN.HP:
-            if self.hp_fil:
-                self.hp_fil = False
-            self.hp_screen()
-        elif self.current_screen == SCREEN.DE:
-            if self.de_emp:
-                self.de_emp = False
-            self.de_screen()
-        elif self.current_screen == SCREEN.NON:
-            if self.non_os:
-                self.non_os = False
-            self.non_screen()
-        elif self.current_screen == SCREEN.PH:
-            if self.ph_comp:
-                self.ph_comp = False
-            self.ph_screen()
-
-    def button_callback(self, btn: Button):
-        self.led_off_counter = 0
-        pin_nr = SW_PIN(btn.pin.number)
-        if pin_nr == SW_PIN.DOWN:
-            self.sw_down_callback()
-        elif pin_nr == SW_PIN.UP:
-            self.sw_up_callback()
-        elif pin_nr == SW_PIN.OK:
-            self.sw_ok_callback()
-        elif pin_nr == SW_PIN.LEFT:
-            self.sw_left_callback()
-        elif pin_nr == SW_PIN.RIGHT:
-            self.sw_right_callback()
-
-
-def main():
-    sound_ctrl = SOUND_CTRL()
-    lcd = OLED(sound_ctrl.card_num, sound_ctrl)
-    lcd.boot_screen()
 
-    def cleanup(*args):
-        lcd.oled.powerDown()
-        sys.exit(0)
+def set_pin_factory(name: str):
+    from gpiozero import Device
 
-    signal.signal(signal.SIGINT, cleanup)
-    signal.signal(signal.SIGHUP, cleanup)
-    signal.signal(signal.SIGTERM, cleanup)
+    module, factory = PIN_FACTORIES[name]
+    Device.pin_factory = getattr(importlib.import_module(module), factory)()
 
-    try:
-        # connect to MPD
-        mpd_client = PersistentMPDClient(host="localhost", port=6600)
-        mpd_client.timeout = 3
-        mpd_client.idletimeout = 3
-    except Exception as e:
-        print(f"Where were error during MPD connection: {e}")
-
-    def remote_callback(ir_dev: InputDevice):
-        PRESS_HOLD_EVENTS = [1, 2]
-        curr_vol = sound_ctrl.ma_ctrl.get_volume()
-        for event in ir_dev.read_loop():
-            if event.type == ecodes.EV_KEY and event.value in PRESS_HOLD_EVENTS:
-                if event.code == ecodes.KEY_RIGHT:
-                    try:
-                        mpd_client.next()
-                    except Exception:
-                        pass
-                elif event.code == ecodes.KEY_LEFT:
-                    try:
-                        mpd_client.previous()
-                    except Exception:
-                        pass
-                elif event.code == ecodes.KEY_MUTE:
-                    sound_ctrl.change_mute_status(sound_ctrl.ma_ctrl)
-                    sound_ctrl.change_mute_status(sound_ctrl.dig_ctrl)
-                    lcd.mute_line()
-                elif event.code == ecodes.KEY_PLAY:
-                    try:
-                        mpd_client.pause()
-                    except Exception:
-                        pass
-                elif event.code == ecodes.KEY_OK:
-                    pass
-                elif event.code == ecodes.KEY_VOLUMEUP:
-                    if curr_vol < 140:
-                        new_vol = curr_vol + 4
-                    elif curr_vol < 220:
-                        new_vol = curr_vol + 2
-                    else:
-                        new_vol = curr_vol + 1
-                    new_vol = min(new_vol, 255)
-                    curr_vol = new_vol
-                    sound_ctrl.dig_ctrl.set_volume_all(new_vol)
-                    sound_ctrl.ma_ctrl.set_volume_all(new_vol)
-                    lcd.volume_line(new_vol)
-                elif event.code == ecodes.KEY_VOLUMEDOWN:
-                    if curr_vol < 140:
-                        new_vol = curr_vol - 4
-                    elif curr_vol < 220:
-                        new_vol = curr_vol - 2
-                    else:
-                        new_vol = curr_vol - 1
-                    new_vol = max(
-                        new_vol,
-                        0,
-                    )
-                    curr_vol = new_vol
-                    sound_ctrl.dig_ctrl.set_volume_all(new_vol)
-                    sound_ctrl.ma_ctrl.set_volume_all(new_vol)
-                    lcd.volume_line(new_vol)
-                else:
-                    pass
-                lcd.led_off_counter = 0
-
-    time.sleep(5)
-
-    # setup IR receiver
-    devices = [InputDevice(path) for path in list_devices()]
-    ir_device: InputDevice
-    # find IR setuped via GPIO
-    for device in devices:
-        if device.name == "gpio_ir_recv":
-            ir_device = InputDevice(device.path)
-            break
-    else:
-        ir_device = None
-    if ir_device:
-        rem_control_thread = threading.Thread(
-            name="ir_control",
-            target=remote_callback,
-            kwargs={"ir_dev": ir_device},
-            daemon=True,
-        )
-        rem_control_thread.start()
-    else:
-        print("WARNING: Did not find any ir device with name gpio_ir_recv")
 
-    lcd.volume_screen()
+def setup_buttons(callback):
+    from gpiozero import Button
+
+    buttons = []
+    for pin in SW_PIN:
+        btn = Button(pin=pin.value, bounce_time=0.05)
+        btn.when_pressed = callback
+        buttons.append(btn)
+    return buttons
 
-    # update hw info line on screen 0
-    s = sched.scheduler(time.time, time.sleep)
 
-    def hw_updater(sc):
-        lcd.hw_line()
-        s.enter(3, 1, hw_updater, (sc,))
+def run_threads(
+    sound_ctrl: SOUND_CTRL,
+    lcd: OLED,
+    remote: REMOTE_CTRL,
+    ir_devices: queue.Queue,
+    max_fps=30,
+):
+    from allo_boss2.mpd_idle import MPDIdleWatcher
 
-    s.enter(3, 1, hw_updater, (s,))
-    hw_up_thread = threading.Thread(name="hw_updater", target=s.run, daemon=True)
-    hw_up_thread.start()
+    # All drawing happens on the renderer thread from here on
+    renderer = Renderer(lcd, max_fps)
+    lcd.renderer = renderer
+    lcd.flush_callback = renderer.mark_dirty
+    renderer.start()
 
-    btn_left = Button(pin=SW_PIN.LEFT.value, bounce_time=0.05)
-    btn_left.when_pressed = lcd.button_callback
-    btn_right = Button(pin=SW_PIN.RIGHT.value, bounce_time=0.05)
-    btn_right.when_pressed = lcd.button_callback
-    btn_up = Button(pin=SW_PIN.UP.value, bounce_time=0.05)
-    btn_up.when_pressed = lcd.button_callback
-    btn_down = Button(pin=SW_PIN.DOWN.value, bounce_time=0.05)
-    btn_down.when_pressed = lcd.button_callback
-    btn_ok = Button(pin=SW_PIN.OK.value, bounce_time=0.05)
-    btn_ok.when_pressed = lcd.button_callback
+    def remote_callback():
+        # the InputDeviceWatcher hands over the device once it exists
+        ir_dev = ir_devices.get()
+        for event in ir_dev.read_loop():
+            remote.handle_event(event)
+
+    rem_control_thread = threading.Thread(
+        name="ir_control", target=remote_callback, daemon=True
+    )
+    rem_control_thread.start()
+
+    lcd.request("screen", lcd.volume_screen)
+
+    # update hw info line on screen 0 when the stream format changes
+    stream_watcher = StreamWatcher(sound_ctrl.card_num)
+    stream_watcher.subscribe(lambda stream: lcd.request("hw", lcd.hw_line, stream))
+    stream_watcher.start()
+    # interpolates the elapsed time of the now playing screen
+    ticker = ElapsedTicker(
+        lambda: lcd.now_playing, lambda: lcd.request("elapsed", lcd.elapsed_line)
+    )
+    ticker.start()
+
+    # scrolls the long lines of the now playing screen
+    marquee_ticker = AnimationTicker(
+        lcd.scrolling, lambda: lcd.request("marquee", lcd.marquee_tick), MARQUEE_FPS
+    )
+    lcd.scroll_callback = marquee_ticker.wake
+    marquee_ticker.start()
+
+    def set_now_playing(now_playing: NowPlaying):
+        lcd.now_playing = now_playing
+        ticker.wake()
+        lcd.request("playing", lcd.now_playing_lines)
+
+    def mpd_event(changed):
+        # MPD player events announce stream changes
+        if "player" in changed:
+            stream_watcher.trigger()
+        set_now_playing(read_now_playing(mpd_watcher.client))
+
+    def mpd_connection(connected):
+        # poll hw_params often while MPD is away, slowly otherwise
+        stream_watcher.set_polling(not connected)
+        if not connected:
+            set_now_playing(NowPlaying())
+
+    mpd_watcher = MPDIdleWatcher(
+        "localhost", 6600, ["player", "mixer", "options"], mpd_event, mpd_connection
+    )
+    mpd_watcher.start()
+
+    def mixer_changed():
+        lcd.request("mixer", lcd.mixer_changed)
+        stream_watcher.trigger()
+
+    # redraw on mixer changes made by other clients
+    MixerWatcher(sound_ctrl, mixer_changed).start()
+
+    # addresses of the SYSINFO screen, as they come and go
+    if lcd.network is not None:
+        NetworkWatcher(
+            lcd.network, lambda: lcd.request("network", lcd.address_lines)
+        ).start()
+
+    # every press counts, never coalesce them
+    buttons = setup_buttons(lambda btn: lcd.request(None, lcd.button_callback, btn))
 
     while True:
-        if lcd.led_off_counter >= 50:
-            lcd.oled.powerDown()
-        elif lcd.led_off_counter == 1:
-            lcd.oled.powerUp()
         time.sleep(1)
-        lcd.led_off_counter += 1
+        lcd.request("screen_off", lcd.screen_off_tick)
+
+
+def main(argv=None, profile: StartupProfile = None):
+    main_started = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Allo Boss2 OLED and remote control")
+    parser.add_argument(
+        "--runtime",
+        choices=["threads", "asyncio"],
+        default="threads",
+        help="run every input and the display on one asyncio event loop",
+    )
+    parser.add_argument(
+        "--max-fps",
+        type=float,
+        default=30,
+        help="most OLED updates per second of the threads runtime (default 30)",
+    )
+    parser.add_argument(
+        "--pin-factory",
+        choices=list(PIN_FACTORIES),
+        default="rpigpio",
+        help="gpiozero pin factory of the buttons (default rpigpio)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print the duration of every startup phase and module import",
+    )
+    args = parser.parse_args(argv)
+
+    if profile is None:
+        # Run as a module, the imports of this module itself are not timed,
+        # the allo_boss2 command (allo_boss2.entry) times them as well
+        profile = StartupProfile(args.profile_startup, IMPORT_STARTED)
+        profile.add_phase("import allo_boss2.boss2_oled", main_started - IMPORT_STARTED)
+
+    # Stage 1: the boot screen, before anything else is probed
+    with profile.phase("network state"):
+        network = NetworkState()
+        try:
+            network.open()
+        except OSError as e:
+            print(f"Network state unavailable: {e}")
+            network.close()
+            network = None
+    with profile.phase("display init"):
+        lcd = OLED(network=network)
+    with profile.phase("boot screen"):
+        lcd.boot_screen()
+
+    def cleanup(*args):
+        lcd.oled.powerDown()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, cleanup)
+    signal.signal(signal.SIGHUP, cleanup)
+    signal.signal(signal.SIGTERM, cleanup)
+
+    # Stage 2: wait for the IR receiver and connect to MPD in the
+    # background while the sound card is probed
+    with profile.phase("IR watcher and MPD connect started"):
+        ir_devices = queue.Queue()
+        InputDeviceWatcher("gpio_ir_recv", ir_devices.put).start()
+
+        mpd_client = None
+        mpd_executor = None
+        if args.runtime == "threads":
+            from allo_boss2.persistent_mpd import PersistentMPDClient
+
+            mpd_client = PersistentMPDClient(host="localhost", port=6600)
+            mpd_client.timeout = 3
+            mpd_client.idletimeout = 3
+            # MPD commands run on their own thread, so the remote keeps handling
+            # volume and mute while MPD is slow to answer. The client connects
+            # lazily, connect now so the first remote key is not delayed.
+            mpd_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mpd")
+            mpd_executor.submit(mpd_client.do_connect)
+
+    with profile.phase("sound card"):
+        sound_ctrl = SOUND_CTRL()
+        lcd.attach_sound(sound_ctrl)
+
+    # Stage 3: the volume screen and the inputs
+    with profile.phase("remote control"):
+        remote = REMOTE_CTRL(sound_ctrl, lcd, mpd_client)
+        if mpd_executor is not None:
+            remote.mpd_submit = lambda cmd: mpd_executor.submit(remote._mpd_call, cmd)
+    with profile.phase(f"pin factory {args.pin_factory}"):
+        set_pin_factory(args.pin_factory)
+    if args.runtime == "asyncio":
+        with profile.phase("import allo_boss2.aio_runtime"):
+            from allo_boss2.aio_runtime import run_asyncio
+        profile.report()
+        run_asyncio(sound_ctrl, lcd, remote, ir_devices)
+    else:
+        profile.report()
+        run_threads(sound_ctrl, lcd, remote, ir_devices, args.max_fps)
 
 
 if __name__ == "__main__":
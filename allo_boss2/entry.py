@@ -0,0 +1,23 @@
+"""
+Entry point of the allo_boss2 command. With --profile-startup the import
+timer is installed before allo_boss2.boss2_oled is imported, so the cost
+of the daemon's own module and everything it imports is broken down too.
+"""
+
+import sys
+
+from allo_boss2.startup_profile import StartupProfile
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    profile = StartupProfile("--profile-startup" in argv)
+    with profile.phase("import allo_boss2.boss2_oled"):
+        from allo_boss2 import boss2_oled
+
+    boss2_oled.main(argv, profile)
+
+
+if __name__ == "__main__":
+    main()
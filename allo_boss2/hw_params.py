@@ -0,0 +1,147 @@
+import os
+import re
+from typing import NamedTuple, Optional
+
+# "key: value" lines of /proc/asound/cardN/pcmXp/subY/{hw_params,status}
+FIELD_RE = re.compile(rb"^(\w+)\s*:\s*(\S+)", re.MULTILINE)
+# Sample format names: S16_LE, S24_3LE, U8, FLOAT_LE, FLOAT64_LE, DSD_U32_BE ...
+FORMAT_RE = re.compile(r"(DSD_U|FLOAT|S|U)(\d+)?")
+
+READ_SIZE = 4096
+
+
+class HwParams(NamedTuple):
+    # ALSA sample format name, None while the PCM is closed
+    format: Optional[str] = None
+    # "S" signed, "U" unsigned, "F" float or "DSD"
+    kind: Optional[str] = None
+    # significant bits per sample (DSD: bits per sample word)
+    bits: int = 0
+    rate: int = 0
+    channels: int = 0
+    period_size: int = 0
+    buffer_size: int = 0
+    # from the status file, only filled in by read(status=True)
+    state: Optional[str] = None
+    delay: int = 0
+
+    @property
+    def closed(self) -> bool:
+        return self.format is None
+
+    @property
+    def label(self) -> str:
+        """Short display form: "S16 44100", "F32 96000", "DSD64" ..."""
+        if self.closed:
+            return "No stream"
+        if self.kind == "DSD":
+            return f"DSD{self.rate * self.bits // 44100}"
+        if self.kind is None:
+            return f"{self.format} {self.rate}"
+        return f"{self.kind}{self.bits} {self.rate}"
+
+
+CLOSED = HwParams()
+
+
+def parse_format(name: str):
+    """Returns (kind, bits) of an ALSA sample format name."""
+    match = FORMAT_RE.match(name)
+    if match is None:
+        return None, 0
+    prefix, bits = match.groups()
+    if prefix == "FLOAT":
+        return "F", int(bits or 32)
+    if bits is None:
+        # e.g. SPECIAL
+        return None, 0
+    if prefix == "DSD_U":
+        return "DSD", int(bits)
+    return prefix, int(bits)
+
+
+def _int(fields, key):
+    try:
+        return int(fields.get(key, b"0"))
+    except ValueError:
+        return 0
+
+
+class ProcFile:
+    """
+    A /proc file kept open and re-read with a single os.pread() from offset
+    0, which makes the kernel generate its content again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+
+    def read(self) -> bytes:
+        try:
+            if self.fd is None:
+                self.fd = os.open(self.path, os.O_RDONLY)
+            return os.pread(self.fd, READ_SIZE, 0)
+        except OSError:
+            # the card may have gone away, reopen on the next read
+            self.close()
+            return b""
+
+    def close(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
+class HwParamsReader:
+    """
+    Reads the hw_params (and optionally status) file of a PCM substream into
+    a HwParams record. The last parsed hw_params is cached by the hash of
+    the file content, so reading an unchanged file skips the parsing.
+    """
+
+    def __init__(self, card_num: int, device: int = 0, subdevice: int = 0):
+        base = f"/proc/asound/card{card_num}/pcm{device}p/sub{subdevice}"
+        self.hw_params_file = ProcFile(f"{base}/hw_params")
+        self.status_file = ProcFile(f"{base}/status")
+        self._cache_key = None
+        self._cache = CLOSED
+
+    def read(self, status: bool = False) -> HwParams:
+        content = self.hw_params_file.read()
+        key = hash(content)
+        if key != self._cache_key:
+            self._cache_key = key
+            self._cache = self.parse_hw_params(content)
+        if not status:
+            return self._cache
+        fields = dict(FIELD_RE.findall(self.status_file.read()))
+        return self._cache._replace(
+            state=fields.get(b"state", b"closed").decode(),
+            delay=_int(fields, b"delay"),
+        )
+
+    @staticmethod
+    def parse_hw_params(content: bytes) -> HwParams:
+        fields = dict(FIELD_RE.findall(content))
+        if b"format" not in fields:
+            # "closed" when no stream is playing
+            return CLOSED
+        name = fields[b"format"].decode()
+        kind, bits = parse_format(name)
+        return HwParams(
+            format=name,
+            kind=kind,
+            bits=bits,
+            rate=_int(fields, b"rate"),
+            channels=_int(fields, b"channels"),
+            period_size=_int(fields, b"period_size"),
+            buffer_size=_int(fields, b"buffer_size"),
+        )
+
+    def close(self):
+        self.hw_params_file.close()
+        self.status_file.close()
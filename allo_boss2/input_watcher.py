@@ -0,0 +1,102 @@
+import ctypes
+import os
+import struct
+import threading
+import time
+
+# linux/inotify.h
+IN_ATTRIB = 0x00000004
+IN_CREATE = 0x00000100
+IN_CLOEXEC = 0o2000000
+# struct inotify_event without the name: wd, mask, cookie, len
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def inotify_watch(directory: str, mask: int):
+    """Returns an inotify fd watching directory, None if inotify is unavailable."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, directory.encode(), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+def read_events(fd: int):
+    """Blocks until inotify events arrive, returns the file names."""
+    data = os.read(fd, 4096)
+    names = []
+    offset = 0
+    while offset + EVENT_HEADER.size <= len(data):
+        _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+        offset += EVENT_HEADER.size
+        names.append(data[offset : offset + length].rstrip(b"\0").decode())
+        offset += length
+    return names
+
+
+class InputDeviceWatcher(threading.Thread):
+    """
+    Finds the input device with the given name and passes it to
+    on_found(device). Devices present at start are checked first, then
+    the thread sleeps in an inotify read on /dev/input until the device
+    node is created (or its permissions are set by udev), instead of
+    sleeping a fixed time hoping the driver is loaded by then. Without
+    inotify it checks every POLL_INTERVAL seconds.
+    """
+
+    POLL_INTERVAL = 1
+
+    def __init__(self, name: str, on_found, directory: str = "/dev/input"):
+        super().__init__(name="input_watcher", daemon=True)
+        self.device_name = name
+        self.on_found = on_found
+        self.directory = directory
+
+    def open_device(self, path: str):
+        # imported by the watcher thread, not while the boot screen is drawn
+        from evdev import InputDevice
+
+        try:
+            device = InputDevice(path)
+        except OSError:
+            # not ready (permissions) or already gone
+            return None
+        if device.name == self.device_name:
+            return device
+        device.close()
+        return None
+
+    def scan(self):
+        from evdev import list_devices
+
+        for path in list_devices(self.directory):
+            device = self.open_device(path)
+            if device is not None:
+                return device
+        return None
+
+    def run(self):
+        # watch before scanning, so a device created meanwhile is not missed
+        fd = inotify_watch(self.directory, IN_CREATE | IN_ATTRIB)
+        device = self.scan()
+        if device is None:
+            print(f"Waiting for input device {self.device_name}")
+        while device is None:
+            if fd is None:
+                time.sleep(self.POLL_INTERVAL)
+                device = self.scan()
+                continue
+            for name in read_events(fd):
+                if name.startswith("event"):
+                    device = self.open_device(os.path.join(self.directory, name))
+                    if device is not None:
+                        break
+        if fd is not None:
+            os.close(fd)
+        self.on_found(device)
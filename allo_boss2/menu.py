@@ -0,0 +1,120 @@
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
+
+
+class Cell(NamedTuple):
+    """A text drawn in the cap font, 2 rows (pages) tall."""
+
+    row: int
+    col: int
+    text: str
+    inverted: bool = False
+
+
+class MenuItem(NamedTuple):
+    label: str
+    # screen opened by OK
+    target: Any
+    # switch attribute of OLED shown after the label, if any
+    attr: Optional[str] = None
+    on: str = ""
+    off: str = ""
+
+
+class ListMenu(NamedTuple):
+    """
+    A list of items, one every 2 rows, the item at the cursor inverted.
+    Without value_col the switch value is appended to the label, otherwise
+    it is drawn at value_col, behind a "| " separator at separator_col.
+    """
+
+    items: Tuple[MenuItem, ...]
+    # OLED attribute holding the 1 based cursor position
+    index_attr: str
+    # screen LEFT goes back to
+    parent: Any
+    label_col: int = 0
+    separator_col: Optional[int] = None
+    value_col: Optional[int] = None
+
+    def cells(self, state) -> Iterator[Cell]:
+        index = getattr(state, self.index_attr)
+        for i, item in enumerate(self.items):
+            row = 2 * i
+            inverted = index == i + 1
+            value = ""
+            if item.attr is not None:
+                value = item.on if getattr(state, item.attr) else item.off
+            if self.value_col is None:
+                yield Cell(row, self.label_col, item.label + value, inverted)
+            else:
+                yield Cell(row, self.label_col, item.label, inverted)
+                yield Cell(row, self.separator_col, "| ", inverted)
+                yield Cell(row, self.value_col, value, inverted)
+
+
+class Toggle(NamedTuple):
+    """
+    Sub-screen selecting the value of one switch. LEFT and RIGHT pick the
+    on or off label, OK writes the value to ALSA and returns to parent.
+    """
+
+    title: str
+    title_col: int
+    attr: str
+    on: str
+    off: str
+    on_col: int
+    off_col: int
+    parent: Any
+
+    def cells(self, state) -> Iterator[Cell]:
+        value = getattr(state, self.attr)
+        yield Cell(0, self.title_col, self.title)
+        yield Cell(3, self.on_col, self.on, value)
+        yield Cell(3, self.off_col, self.off, not value)
+        yield Cell(6, 50, "OK", state.ok_flag)
+
+
+class MenuView:
+    """
+    Draws the cells of a menu screen into the SH1106LCD framebuffer with
+    row-level invalidation. The cells last drawn on every row are
+    remembered and a redraw only clears and draws again the rows whose
+    cells changed: moving the cursor redraws the two rows losing and
+    gaining the highlight, toggling a value the on/off pair and, if its
+    state changed, the OK marker. reset() must be called whenever the
+    screen is cleared or drawn by other means.
+    """
+
+    def __init__(self, oled):
+        self.oled = oled
+        # row -> cells drawn on it
+        self.rows = {}
+        # rows redrawn since creation, for benchmarks
+        self.redraws = 0
+
+    def reset(self):
+        self.rows.clear()
+
+    def draw(self, cells) -> int:
+        """Returns the number of rows redrawn."""
+        rows = {}
+        for cell in cells:
+            rows.setdefault(cell.row, []).append(cell)
+        count = 0
+        for row, row_cells in rows.items():
+            row_cells = tuple(row_cells)
+            if self.rows.get(row) == row_cells:
+                continue
+            # cells are 2 pages tall
+            self.oled.clearRow(row)
+            self.oled.clearRow(row + 1)
+            for cell in row_cells:
+                if cell.inverted:
+                    self.oled.displayInvertedString(cell.text, cell.row, cell.col)
+                else:
+                    self.oled.displayString(cell.text, cell.row, cell.col)
+            self.rows[row] = row_cells
+            count += 1
+        self.redraws += count
+        return count
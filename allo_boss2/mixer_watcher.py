@@ -0,0 +1,31 @@
+import select
+import threading
+
+
+class MixerWatcher(threading.Thread):
+    """
+    Waits on the poll descriptors of the ALSA mixer and hcontrol handles of
+    SOUND_CTRL and calls on_change() after their events were handled.  The
+    thread sleeps in poll() without a timeout, so it only wakes when a
+    control of the card changes, whoever changed it.
+    """
+
+    def __init__(self, snd_ctrl, on_change):
+        super().__init__(name="mixer_watcher", daemon=True)
+        self.snd_ctrl = snd_ctrl
+        self.on_change = on_change
+
+    def run(self):
+        poller = select.poll()
+        for fd, events in self.snd_ctrl.mixer.poll_fds:
+            poller.register(fd, events)
+        for fd, events in self.snd_ctrl.hctl.poll_fds:
+            poller.register(fd, events)
+        while True:
+            poller.poll()
+            self.snd_ctrl.mixer.handle_events()
+            self.snd_ctrl.hctl.handle_events()
+            try:
+                self.on_change()
+            except Exception as e:
+                print(f"Mixer change handling failed: {e}")
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import mpd
+
+
+class MPDIdleWatcher(threading.Thread):
+    """
+    Keeps a dedicated MPD connection in "idle" and calls on_event(changed)
+    with the list of changed subsystems. on_connection(connected) is called
+    when the connection is established or lost. Lost connections are
+    re-established with exponential backoff. Any other error, of MPD or of
+    a callback, is logged and the connection re-established the same way,
+    the thread never ends.
+
+    on_event runs on this thread between two idle commands, so it may query
+    MPD through self.client, e.g. status after a "player" event.
+    """
+
+    BACKOFF_MIN = 1
+    BACKOFF_MAX = 30
+
+    def __init__(self, host, port, subsystems, on_event, on_connection=None):
+        super().__init__(name="mpd_idle", daemon=True)
+        self.host = host
+        self.port = port
+        self.subsystems = list(subsystems)
+        self.on_event = on_event
+        self.on_connection = on_connection
+        # connected mpd.MPDClient, None while disconnected
+        self.client = None
+
+    def _connection(self, connected):
+        if self.on_connection is not None:
+            try:
+                self.on_connection(connected)
+            except Exception as e:
+                print(f"MPD connection callback failed: {e!r}")
+
+    def run(self):
+        backoff = self.BACKOFF_MIN
+        while True:
+            client = mpd.MPDClient()
+            client.timeout = 3
+            # idle blocks until something changes
+            client.idletimeout = None
+            try:
+                client.connect(self.host, self.port)
+                self.client = client
+                self._connection(True)
+                backoff = self.BACKOFF_MIN
+                # report the state at (re)connect time
+                self.on_event(self.subsystems)
+                while True:
+                    self.on_event(client.idle(*self.subsystems))
+            except (mpd.ConnectionError, OSError) as e:
+                print(f"MPD idle connection lost: {e}")
+            except Exception as e:
+                # e.g. a CommandError of status in on_event, start over
+                print(f"MPD idle event handling failed: {e!r}")
+            finally:
+                self.client = None
+                self._connection(False)
+                try:
+                    client.disconnect()
+                except Exception:
+                    pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.BACKOFF_MAX)
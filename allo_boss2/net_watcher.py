@@ -0,0 +1,252 @@
+import errno
+import select
+import socket
+import struct
+import threading
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+# linux/netlink.h, linux/rtnetlink.h, linux/if_link.h, linux/if_addr.h
+NETLINK_ROUTE = 0
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x001
+NLM_F_DUMP = 0x300
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_GETLINK = 18
+RTM_NEWADDR = 20
+RTM_DELADDR = 21
+RTM_GETADDR = 22
+RTMGRP_LINK = 0x001
+RTMGRP_IPV4_IFADDR = 0x010
+RTMGRP_IPV6_IFADDR = 0x100
+IFLA_IFNAME = 3
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFF_UP = 0x1
+IFF_LOOPBACK = 0x8
+RT_SCOPE_UNIVERSE = 0
+
+NLMSGHDR = struct.Struct("=IHHII")
+IFINFOMSG = struct.Struct("=BxHiII")
+IFADDRMSG = struct.Struct("=BBBBi")
+RTATTR = struct.Struct("=HH")
+
+RECV_SIZE = 65536
+
+
+class Address(NamedTuple):
+    # socket.AF_INET or socket.AF_INET6
+    family: int
+    address: str
+    prefixlen: int
+    # RT_SCOPE_UNIVERSE for global addresses
+    scope: int
+
+
+class Interface(NamedTuple):
+    index: int
+    name: str
+    # IFF_* flags
+    flags: int
+    addresses: Tuple[Address, ...] = ()
+
+    @property
+    def up(self) -> bool:
+        return bool(self.flags & IFF_UP)
+
+    @property
+    def loopback(self) -> bool:
+        return bool(self.flags & IFF_LOOPBACK)
+
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def parse_messages(data: bytes):
+    """Yields (type, seq, payload) of every netlink message in data."""
+    offset = 0
+    while offset + NLMSGHDR.size <= len(data):
+        length, kind, _, seq, _ = NLMSGHDR.unpack_from(data, offset)
+        if length < NLMSGHDR.size:
+            return
+        yield kind, seq, data[offset + NLMSGHDR.size : offset + length]
+        offset += _align(length)
+
+
+def parse_attributes(data: bytes, offset: int) -> Dict[int, bytes]:
+    attributes = {}
+    while offset + RTATTR.size <= len(data):
+        length, kind = RTATTR.unpack_from(data, offset)
+        if length < RTATTR.size:
+            break
+        attributes[kind] = data[offset + RTATTR.size : offset + length]
+        offset += _align(length)
+    return attributes
+
+
+def display_addresses(interfaces: Tuple[Interface, ...]) -> List[str]:
+    """
+    The global addresses of the interfaces that are up, best first: IPv4
+    before IPv6, wired before wireless before any other interface.
+    """
+
+    def rank(name: str) -> int:
+        if name.startswith(("eth", "en")):
+            return 0
+        if name.startswith(("wlan", "wl")):
+            return 1
+        return 2
+
+    found = []
+    for interface in interfaces:
+        if not interface.up or interface.loopback:
+            continue
+        for address in interface.addresses:
+            if address.scope == RT_SCOPE_UNIVERSE:
+                key = (address.family != socket.AF_INET, rank(interface.name))
+                found.append((key, interface.index, address.address))
+    return [address for _, _, address in sorted(found)]
+
+
+class NetworkState:
+    """
+    Cached snapshot of the network interfaces and their addresses, kept up
+    to date by rtnetlink. open() subscribes to link and IPv4/IPv6 address
+    events and dumps the current state, handle_events() then applies the
+    events queued on the socket. interfaces is replaced, never modified,
+    so readers need neither a lock nor a syscall.
+    """
+
+    def __init__(self):
+        self.sock = None
+        self.seq = 0
+        self.interfaces: Tuple[Interface, ...] = ()
+        # index -> (name, flags)
+        self.links: Dict[int, Tuple[str, int]] = {}
+        # index -> (family, address) -> Address
+        self.addresses: Dict[int, Dict[Tuple[int, str], Address]] = {}
+
+    def open(self):
+        self.sock = socket.socket(
+            socket.AF_NETLINK, socket.SOCK_RAW | socket.SOCK_CLOEXEC, NETLINK_ROUTE
+        )
+        # subscribe first, so no change between the dump and now is missed
+        self.sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV6_IFADDR))
+        self.resync()
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def resync(self) -> bool:
+        """Rebuilds the snapshot from a full dump, True if it changed."""
+        self.links = {}
+        self.addresses = {}
+        self._dump(RTM_GETLINK, IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0))
+        self._dump(RTM_GETADDR, IFADDRMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0))
+        return self._publish()
+
+    def _dump(self, kind: int, payload: bytes):
+        # the kernel runs one dump per socket at a time
+        self.seq += 1
+        header = NLMSGHDR.pack(
+            NLMSGHDR.size + len(payload), kind, NLM_F_REQUEST | NLM_F_DUMP, self.seq, 0
+        )
+        self.sock.send(header + payload)
+        while True:
+            for reply, seq, data in parse_messages(self.sock.recv(RECV_SIZE)):
+                if seq == self.seq and reply == NLMSG_DONE:
+                    return
+                if seq == self.seq and reply == NLMSG_ERROR:
+                    error = -struct.unpack_from("=i", data)[0]
+                    raise OSError(error, "rtnetlink dump failed")
+                # events arriving meanwhile are applied in order as well
+                self._apply(reply, data)
+
+    def handle_events(self) -> bool:
+        """Applies the queued events without blocking, True if anything changed."""
+        changed = False
+        while True:
+            try:
+                data = self.sock.recv(RECV_SIZE, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                return self._publish() or changed
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                # the kernel dropped events, start over from a dump
+                changed = self.resync() or changed
+                continue
+            for kind, _, payload in parse_messages(data):
+                self._apply(kind, payload)
+
+    def _apply(self, kind: int, payload: bytes):
+        if kind in (RTM_NEWLINK, RTM_DELLINK):
+            _, _, index, flags, _ = IFINFOMSG.unpack_from(payload)
+            if kind == RTM_DELLINK:
+                self.links.pop(index, None)
+                self.addresses.pop(index, None)
+                return
+            name = parse_attributes(payload, IFINFOMSG.size).get(IFLA_IFNAME, b"")
+            self.links[index] = (name.rstrip(b"\0").decode(errors="replace"), flags)
+        elif kind in (RTM_NEWADDR, RTM_DELADDR):
+            family, prefixlen, _, scope, index = IFADDRMSG.unpack_from(payload)
+            if family not in (socket.AF_INET, socket.AF_INET6):
+                return
+            attributes = parse_attributes(payload, IFADDRMSG.size)
+            # IFA_ADDRESS is the peer of point to point links, IFA_LOCAL ours
+            raw = attributes.get(IFA_LOCAL) or attributes.get(IFA_ADDRESS)
+            if raw is None:
+                return
+            address = socket.inet_ntop(family, raw)
+            addresses = self.addresses.setdefault(index, {})
+            if kind == RTM_DELADDR:
+                addresses.pop((family, address), None)
+            else:
+                addresses[(family, address)] = Address(
+                    family, address, prefixlen, scope
+                )
+
+    def _publish(self) -> bool:
+        interfaces = tuple(
+            Interface(
+                index,
+                name,
+                flags,
+                tuple(self.addresses.get(index, {}).values()),
+            )
+            for index, (name, flags) in sorted(self.links.items())
+        )
+        if interfaces == self.interfaces:
+            return False
+        self.interfaces = interfaces
+        return True
+
+
+class NetworkWatcher(threading.Thread):
+    """
+    Sleeps in poll() on the rtnetlink socket of a NetworkState and calls
+    on_change() after an event changed its snapshot.
+    """
+
+    def __init__(self, state: NetworkState, on_change: Callable[[], None]):
+        super().__init__(name="net_watcher", daemon=True)
+        self.state = state
+        self.on_change = on_change
+
+    def run(self):
+        poller = select.poll()
+        poller.register(self.state.fileno(), select.POLLIN)
+        while True:
+            poller.poll()
+            try:
+                if self.state.handle_events():
+                    self.on_change()
+            except Exception as e:
+                print(f"Network state update failed: {e}")
@@ -0,0 +1,130 @@
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def format_time(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+    return f"{seconds // 60}:{seconds % 60:02}"
+
+
+class NowPlaying(NamedTuple):
+    # "play", "pause" or "stop"
+    state: str = "stop"
+    artist: str = ""
+    title: str = ""
+    # seconds played at timestamp
+    elapsed: float = 0.0
+    duration: float = 0.0
+    # time.monotonic() when elapsed was read
+    timestamp: float = 0.0
+    repeat: bool = False
+    random: bool = False
+    single: bool = False
+
+    @classmethod
+    def from_mpd(cls, status: dict, song: dict, timestamp: float) -> "NowPlaying":
+        """Builds the record from the replies to status and currentsong."""
+        # tags occurring several times are returned as lists
+        title = song.get("title") or song.get("name")
+        if isinstance(title, list):
+            title = title[0]
+        if not title:
+            # untagged file, show its name without the directories
+            title = song.get("file", "").rsplit("/", 1)[-1]
+        artist = song.get("artist", "")
+        if isinstance(artist, list):
+            artist = ", ".join(artist)
+        return cls(
+            state=status.get("state", "stop"),
+            artist=artist,
+            title=title,
+            elapsed=_float(status.get("elapsed")),
+            duration=_float(status.get("duration") or song.get("duration")),
+            timestamp=timestamp,
+            repeat=status.get("repeat") == "1",
+            random=status.get("random") == "1",
+            single=status.get("single") == "1",
+        )
+
+    @property
+    def playing(self) -> bool:
+        return self.state == "play"
+
+    def position(self, now: Optional[float] = None) -> float:
+        """Elapsed seconds interpolated to now, without asking MPD again."""
+        if not self.playing:
+            return self.elapsed
+        if now is None:
+            now = time.monotonic()
+        position = self.elapsed + now - self.timestamp
+        if self.duration:
+            position = min(position, self.duration)
+        return position
+
+    def next_second(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the displayed position changes, None if it does not."""
+        if not self.playing:
+            return None
+        if now is None:
+            now = time.monotonic()
+        return 1.0 - self.position(now) % 1.0
+
+    @property
+    def flags(self) -> str:
+        flags = [self.state.upper()]
+        if self.repeat:
+            flags.append("RPT")
+        if self.random:
+            flags.append("RND")
+        if self.single:
+            flags.append("SGL")
+        return " ".join(flags)
+
+
+def read_now_playing(client) -> NowPlaying:
+    """Queries a connected, not idling mpd.MPDClient."""
+    status = client.status()
+    timestamp = time.monotonic()
+    return NowPlaying.from_mpd(status, client.currentsong(), timestamp)
+
+
+class ElapsedTicker(threading.Thread):
+    """
+    Calls on_tick() whenever the whole second of the interpolated position
+    of get_state() changes, sleeping until exactly then. While nothing is
+    playing it sleeps until wake() is called, which must be done whenever
+    the state changes.
+    """
+
+    def __init__(
+        self, get_state: Callable[[], NowPlaying], on_tick: Callable[[], None]
+    ):
+        super().__init__(name="elapsed_ticker", daemon=True)
+        self.get_state = get_state
+        self.on_tick = on_tick
+        self.woken = threading.Event()
+
+    def wake(self):
+        self.woken.set()
+
+    def run(self):
+        while True:
+            delay = self.get_state().next_second()
+            # just past the boundary, so the new second is displayed
+            if self.woken.wait(None if delay is None else delay + 0.01):
+                self.woken.clear()
+                continue
+            try:
+                self.on_tick()
+            except Exception as e:
+                print(f"Elapsed time update failed: {e}")
@@ -1,5 +1,33 @@
 import mpd
 
+# Commands wrapped in the reconnect-retry wrapper. A static table, so the
+# client does not need to ask MPD for "commands" before it can be used.
+COMMANDS = (
+    "clearerror",
+    "consume",
+    "currentsong",
+    "next",
+    "pause",
+    "play",
+    "playid",
+    "previous",
+    "random",
+    "repeat",
+    "seekcur",
+    "setvol",
+    "single",
+    "stats",
+    "status",
+    "stop",
+    "volume",
+)
+
+# Errors of a connection the server had already closed, so the command
+# never ran and can be sent again. mpd.ConnectionError is raised e.g. on
+# "Not connected" or "Connection lost while reading line". Other OSErrors,
+# a read timeout in particular, may come after MPD ran the command.
+RECONNECT_ERRORS = (mpd.ConnectionError, BrokenPipeError, ConnectionResetError)
+
 
 class PersistentMPDClient(mpd.MPDClient):
     def __init__(self, socket=None, host=None, port=None):
@@ -7,49 +35,44 @@ class PersistentMPDClient(mpd.MPDClient):
         self.socket = socket
         self.host = host
         self.port = port
+        # connect lazily, on the first command
+        self.connected = False
 
-        self.do_connect()
-        # get list of available commands from client
-        self.command_list = self.commands()
-
-        # commands not to intercept
-        self.command_blacklist = ["ping"]
-
-        # wrap all valid MPDClient functions
-        # in a ping-connection-retry wrapper
-        for cmd in self.command_list:
-            if cmd not in self.command_blacklist:
-                if hasattr(super(), cmd):
-                    super_fun = super().__getattribute__(cmd)
-                    new_fun = self.try_cmd(super_fun)
-                    print(f"Setting interceptor for {cmd}")
-                    setattr(self, cmd, new_fun)
-                else:
-                    print(f"Attr {cmd} not available!")
+        # wrap the MPDClient functions of COMMANDS
+        # in a connection-retry wrapper
+        for cmd in COMMANDS:
+            if hasattr(super(), cmd):
+                super_fun = super().__getattribute__(cmd)
+                setattr(self, cmd, self.try_cmd(super_fun))
 
     # create a wrapper for a function (such as an MPDClient
-    # member function) that will verify a connection (and
-    # reconnect if necessary) before executing that function.
-    # functions wrapped in this way should always succeed
-    # (if the server is up)
-    # we ping first because we don't want to retry the same
-    # function if there's a failure, we want to use the noop
-    # to check connectivity
+    # member function) that sends the command right away and only
+    # if the connection turns out to be lost reconnects and
+    # retries it once. This costs no round trip while connected,
+    # unlike pinging first. Commands that may have run, e.g. after
+    # a timeout, are never retried.
     def try_cmd(self, cmd_fun):
         def fun(*pargs, **kwargs):
+            if not self.connected:
+                # just (re)connected, nothing to retry
+                self.do_connect()
+                return cmd_fun(*pargs, **kwargs)
             try:
-                #                print("Attemping to ping...")
-                self.ping()
-            except (mpd.ConnectionError, OSError):
-                #                print("lost connection.")
-                #                print("trying to reconnect.")
+                return cmd_fun(*pargs, **kwargs)
+            except RECONNECT_ERRORS:
                 self.do_connect()
-            return cmd_fun(*pargs, **kwargs)
+                return cmd_fun(*pargs, **kwargs)
+            except OSError:
+                # not repeated, a timed out "next" may have skipped already.
+                # Its reply may still arrive, so reconnect for the next one.
+                self.connected = False
+                raise
 
         return fun
 
     # needs a name that does not collide with parent connect() function
     def do_connect(self):
+        self.connected = False
         try:
             try:
                 self.disconnect()
@@ -72,5 +95,6 @@ class PersistentMPDClient(mpd.MPDClient):
                 self.connect(self.socket, None)
             else:
                 self.connect(self.host, self.port)
+            self.connected = True
         except OSError as e:
             print(f"Connection refused. Error: {e}")
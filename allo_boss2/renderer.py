@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class Renderer(threading.Thread):
+    """
+    Serializes all drawing on one thread. Other threads submit intents,
+    a callable with its arguments, under a key. Intents submitted under the
+    same key before the renderer gets to them are coalesced: only the last
+    one runs, so a burst of 30 volume steps is drawn once with the latest
+    value. Intents with key None are never coalesced (button presses).
+    Intents run in submission order and draw into the framebuffer only,
+    the panel is flushed once per frame and at most max_fps times a second.
+    """
+
+    def __init__(self, lcd, max_fps: float = 30):
+        super().__init__(name="renderer", daemon=True)
+        self.lcd = lcd
+        self.frame_time = 1.0 / max_fps
+        self.lock = threading.Lock()
+        self.pending = OrderedDict()
+        self.wake = threading.Event()
+        self.dirty = False
+        self.frames = 0
+        self.intents = 0
+        self.coalesced = 0
+
+    def submit(self, key, func, *args):
+        with self.lock:
+            if key is None:
+                key = object()
+            elif self.pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self.pending[key] = (func, args)
+        self.wake.set()
+
+    # OLED flush_callback, drawing is done and the panel is out of date
+    def mark_dirty(self):
+        self.dirty = True
+        self.wake.set()
+
+    def run(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            with self.lock:
+                intents = self.pending
+                self.pending = OrderedDict()
+            for func, args in intents.values():
+                self.intents += 1
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Render intent failed: {e}")
+            if not self.dirty:
+                continue
+            self.dirty = False
+            frame_start = time.monotonic()
+            with self.lcd.t_lock:
+                self.lcd.oled.flush()
+            self.frames += 1
+            # Intents arriving until the next frame are coalesced meanwhile
+            time.sleep(max(0.0, frame_start + self.frame_time - time.monotonic()))
+
+
+class AnimationTicker(threading.Thread):
+    """
+    Calls on_frame() fps times a second while is_active() returns True,
+    e.g. to submit the next step of a scrolling line. Once inactive it
+    sleeps until wake() is called.
+    """
+
+    def __init__(self, is_active, on_frame, fps: float = 25):
+        super().__init__(name="animation", daemon=True)
+        self.is_active = is_active
+        self.on_frame = on_frame
+        self.frame_time = 1.0 / fps
+        self.woken = threading.Event()
+
+    def wake(self):
+        self.woken.set()
+
+    def run(self):
+        while True:
+            self.woken.wait()
+            self.woken.clear()
+            next_frame = time.monotonic()
+            while True:
+                try:
+                    if not self.is_active():
+                        break
+                    self.on_frame()
+                except Exception as e:
+                    print(f"Animation frame failed: {e}")
+                now = time.monotonic()
+                # don't catch up on frames missed, drop them
+                next_frame = max(next_frame + self.frame_time, now)
+                time.sleep(next_frame - now)
@@ -0,0 +1,124 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _TimedLoader:
+    """Wraps the loader of a module spec, timing exec_module()."""
+
+    def __init__(self, loader, timer, name):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._timer.stack()
+        # children add their time here, so the self time can be told apart
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            self._timer.record(self._name, total, total - children)
+
+
+class ImportTimer:
+    """
+    Meta path finder measuring how long every module imported while it is
+    installed takes to execute, like python3 -X importtime. Finding and
+    loading is left to the other finders, their loaders are only wrapped.
+    Imports of every thread are timed, nested imports are subtracted from
+    the self time of the importing module.
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def stack(self):
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    def record(self, name, total, own):
+        with self.lock:
+            self.timings[name] = (total, own)
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+class StartupProfile:
+    """
+    Collects the duration of the named startup phases and, when enabled,
+    of every module imported meanwhile. report() prints both.
+    """
+
+    def __init__(self, enabled=False, started=None):
+        self.enabled = enabled
+        self.started = time.perf_counter() if started is None else started
+        self.phases = []
+        self.imports = ImportTimer() if enabled else None
+        if self.imports is not None:
+            self.imports.install()
+
+    def add_phase(self, name, seconds):
+        self.phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def report(self, modules=25, file=None):
+        if not self.enabled:
+            return
+        self.imports.uninstall()
+        file = sys.stdout if file is None else file
+        print("Startup phases (ms):", file=file)
+        for name, seconds in self.phases:
+            print(f"{seconds * 1000:9.1f}  {name}", file=file)
+        total = time.perf_counter() - self.started
+        print(f"{total * 1000:9.1f}  total", file=file)
+
+        with self.imports.lock:
+            timings = sorted(
+                self.imports.timings.items(), key=lambda item: item[1][1], reverse=True
+            )
+        print(f"Slowest of {len(timings)} imports (ms):", file=file)
+        print("     self cumulative  module", file=file)
+        for name, (cumulative, own) in timings[:modules]:
+            print(f"{own * 1000:9.1f} {cumulative * 1000:10.1f}  {name}", file=file)
+        file.flush()
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Callable, List
+
+from allo_boss2.hw_params import HwParams, HwParamsReader
+
+
+class StreamWatcher(threading.Thread):
+    """
+    Publishes the format of the playback stream to subscribers whenever it
+    changes. Instead of re-reading hw_params periodically it waits for
+    trigger() calls from event sources (MPD player events, ALSA control
+    events). After a trigger hw_params is read at each of REREAD_DELAYS, as
+    the PCM is opened or reconfigured shortly after the event announcing it.
+    While no event source is available (set_polling(True)) it falls back to
+    reading every poll_interval seconds. Otherwise it still reads every
+    SLOW_POLL_INTERVAL seconds, players other than MPD (shairport-sync,
+    squeezelite, direct ALSA clients) open the PCM without any event.
+    """
+
+    # Seconds after a trigger at which hw_params is read
+    REREAD_DELAYS = (0.05, 0.2, 0.6, 1.5)
+    # Seconds between reads while MPD events trigger them
+    SLOW_POLL_INTERVAL = 10
+
+    def __init__(self, card_num: int, poll_interval: float = 3):
+        super().__init__(name="stream_watcher", daemon=True)
+        self.reader = HwParamsReader(card_num)
+        self.poll_interval = poll_interval
+        self.polling = False
+        self.current = None
+        self.subscribers: List[Callable[[HwParams], None]] = []
+        self.triggered = threading.Event()
+
+    def subscribe(self, callback: Callable[[HwParams], None]):
+        self.subscribers.append(callback)
+
+    def trigger(self):
+        self.triggered.set()
+
+    def set_polling(self, polling: bool):
+        self.polling = polling
+        self.trigger()
+
+    def update(self):
+        stream = self.reader.read()
+        if stream != self.current:
+            self.current = stream
+            for callback in self.subscribers:
+                try:
+                    callback(stream)
+                except Exception as e:
+                    print(f"Stream format subscriber failed: {e}")
+
+    def run(self):
+        self.update()
+        while True:
+            timeout = self.poll_interval if self.polling else self.SLOW_POLL_INTERVAL
+            if not self.triggered.wait(timeout):
+                self.update()
+                continue
+            self.triggered.clear()
+            # Triggers arriving meanwhile start another round afterwards
+            start = time.monotonic()
+            for delay in self.REREAD_DELAYS:
+                time.sleep(max(0.0, start + delay - time.monotonic()))
+                self.update()
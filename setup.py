@@ -22,7 +22,7 @@ config = {
     "author_email": "tomaxsas@gmail.com",
     "version": VERSION,
     "license": "GPL v3.0",
-    "entry_points": {"console_scripts": ["allo_boss2=allo_boss2.boss2_oled:main"]},
+    "entry_points": {"console_scripts": ["allo_boss2=allo_boss2.entry:main"]},
     "packages": ["allo_boss2", "allo_boss2.Hardware", "allo_boss2.Hardware.SH1106"],
     "data_files": [
         ("/etc/rc_keymaps/", ["allo_boss2_remote.toml"]),